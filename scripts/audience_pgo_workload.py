@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Training workload for PGO/BOLT builds of the Python interpreter.
+
+Replays audience categorization across every audience category and
+relationship level, so profile-guided layout sees each branch of the
+audience adapter. See docs/ops/pgo-build.md.
+"""
+
+import argparse
+import itertools
+
+from mcg_agent.voice_features.adapters.audience_voice_adapter import AudienceVoiceAdapter
+from mcg_agent.voice_features.protocols.voice_adaptation_protocol import (
+    AdaptationContext,
+    ContextType,
+)
+
+# At least one audience per category, plus a few that fall through to 'general'
+AUDIENCES = (
+    "Executive team and the CEO",
+    "Board of directors and VP of sales",
+    "Senior engineers on the platform team",
+    "Technical architects and developers",
+    "Creative designers and the marketing department",
+    "Content artists",
+    "Customer support users",
+    "Enterprise clients and buyers",
+    "Colleagues on my team",
+    "Peers and staff across the org",
+    "My friend and old buddy",
+    "Family, mom and dad",
+    "My sister and brother",
+    "General public",
+    "",
+)
+
+RELATIONSHIP_LEVELS = (None, "stranger", "acquaintance", "friend", "family", "unknown")
+
+
+def run(iterations: int) -> None:
+    adapter = AudienceVoiceAdapter(voice_applicator=None)
+    contexts = [
+        AdaptationContext(
+            context_type=context_type,
+            audience=audience or None,
+            relationship_level=relationship_level,
+            formality_level=formality_level,
+        )
+        for audience, relationship_level, context_type, formality_level in itertools.product(
+            AUDIENCES, RELATIONSHIP_LEVELS, ContextType, (None, 0.3, 0.8)
+        )
+    ]
+
+    for _ in range(iterations):
+        for context in contexts:
+            audience_lower = (context.audience or "").lower()
+            analysis = adapter._analyze_audience(context, audience_lower)
+            profile = adapter._get_audience_profile(analysis)
+            relationship = adapter._get_relationship_adjustments(context)
+            adapter._combine_adaptation_factors(profile, relationship, context)
+            adapter.analyze_audience_preferences(audience_lower, context)
+            adapter.get_audience_voice_adjustments(profile.category, context.relationship_level)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+    run(args.iterations)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,7 @@ import os
 import json
 import base64
 import hashlib
+import zlib
 from typing import Dict, List, Any, Optional, Union
 from datetime import datetime
 from pathlib import Path
@@ -23,6 +24,10 @@ from mcg_agent.utils.exceptions import EncryptionError, DecryptionError
 from mcg_agent.utils.audit import AuditLogger
 
 
+# Header marking zlib-compressed plaintext; JSON payloads never start with it
+COMPRESSION_MAGIC = b"MCZ1"
+
+
 class EncryptedCorpus(BaseModel):
     """Encrypted corpus data with metadata"""
     corpus_type: str = Field(description="Type of corpus: personal, social, published")
@@ -303,6 +308,80 @@ class PersonalDataEncryption:
         except Exception as e:
             raise EncryptionError(f"Failed to encrypt published corpus: {str(e)}")
             
+    def encrypt_personal_data_bytes(
+        self,
+        payload: bytes,
+        label: str,
+        compress: bool = False
+    ) -> EncryptedCorpus:
+        """
+        Encrypt an already-serialized personal payload (e.g. a voice fingerprint).
+
+        Accepts UTF-8 bytes directly so callers that serialize to bytes avoid a
+        str -> bytes copy of the payload.
+
+        Args:
+            payload: Serialized UTF-8 payload
+            label: Identifier for the payload (recorded in metadata and audit)
+            compress: zlib-compress the payload before encrypting; worthwhile
+                for large, redundant JSON such as voice fingerprints
+
+        Returns:
+            EncryptedCorpus: Encrypted payload data
+        """
+        try:
+            # Calculate hash for integrity (always over the uncompressed payload)
+            data_hash = self._calculate_data_hash(payload)
+
+            plaintext = payload
+            if compress:
+                plaintext = COMPRESSION_MAGIC + zlib.compress(payload, 3)
+
+            # Encrypt data
+            fernet = self._keys["personal"]
+            encrypted_data = fernet.encrypt(plaintext)
+
+            encrypted_corpus = EncryptedCorpus(
+                corpus_type="personal",
+                encrypted_data=base64.b64encode(encrypted_data).decode(),
+                encryption_metadata={
+                    "algorithm": "AES-256",
+                    "mode": "Fernet",
+                    "label": label,
+                    "compression": "zlib" if compress else None,
+                    "original_size": len(payload),
+                    "encrypted_size": len(encrypted_data)
+                },
+                data_hash=data_hash
+            )
+
+            self.audit_logger.log_security_event(
+                event_type="personal_data_encrypted",
+                details={
+                    "label": label,
+                    "original_size": len(payload),
+                    "encrypted_size": len(encrypted_data)
+                }
+            )
+
+            return encrypted_corpus
+
+        except Exception as e:
+            raise EncryptionError(f"Failed to encrypt personal data '{label}': {str(e)}")
+
+    def encrypt_personal_data(self, data: str, label: str) -> EncryptedCorpus:
+        """
+        Encrypt a serialized personal payload given as text.
+
+        Args:
+            data: Serialized payload
+            label: Identifier for the payload
+
+        Returns:
+            EncryptedCorpus: Encrypted payload data
+        """
+        return self.encrypt_personal_data_bytes(data.encode('utf-8'), label)
+
     def decrypt_corpus(self, encrypted_corpus: EncryptedCorpus) -> List[Dict[str, Any]]:
         """
         Decrypt corpus data and verify integrity.
@@ -324,6 +403,10 @@ class PersonalDataEncryption:
             fernet = self._keys[corpus_type]
             decrypted_bytes = fernet.decrypt(encrypted_data)
             
+            # Undo optional compression applied by encrypt_personal_data_bytes
+            if decrypted_bytes.startswith(COMPRESSION_MAGIC):
+                decrypted_bytes = zlib.decompress(decrypted_bytes[len(COMPRESSION_MAGIC):])
+                
             # Verify data integrity
             calculated_hash = self._calculate_data_hash(decrypted_bytes)
             if calculated_hash != encrypted_corpus.data_hash:
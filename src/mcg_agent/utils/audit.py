@@ -50,6 +50,32 @@ class AuditLogger:
             }
         )
 
+    @staticmethod
+    def _log(level: str, message: str, args: tuple[Any, ...]) -> None:
+        # %-style arguments are only interpolated when a record is emitted
+        print(
+            {
+                "audit": {
+                    "ts": datetime.utcnow().isoformat(),
+                    "event": "log",
+                    "level": level,
+                    "message": message % args if args else message,
+                }
+            }
+        )
+
+    @staticmethod
+    def log_info(message: str, *args: Any) -> None:
+        AuditLogger._log("info", message, args)
+
+    @staticmethod
+    def log_warning(message: str, *args: Any) -> None:
+        AuditLogger._log("warning", message, args)
+
+    @staticmethod
+    def log_error(message: str, *args: Any) -> None:
+        AuditLogger._log("error", message, args)
+
 
 __all__ = ["AuditLogger"]
 
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from typing import Dict, Iterable, List
+
+
+class CountMinSketch:
+    """Approximate frequency counts in fixed memory (never underestimates)."""
+
+    def __init__(self, width: int = 4096, depth: int = 4) -> None:
+        self.width = width
+        self.depth = depth
+        self._rows: List[List[int]] = [[0] * width for _ in range(depth)]
+
+    def _indexes(self, item: str) -> List[int]:
+        # Double hashing: row i uses h1 + i * h2
+        h1 = hash(item)
+        h2 = hash((item, 0x9E3779B9)) | 1
+        return [(h1 + i * h2) % self.width for i in range(self.depth)]
+
+    def add(self, item: str, count: int = 1) -> int:
+        """Add ``count`` occurrences of ``item`` and return its new estimate."""
+        estimate = None
+        for row, idx in zip(self._rows, self._indexes(item)):
+            row[idx] += count
+            if estimate is None or row[idx] < estimate:
+                estimate = row[idx]
+        return estimate or 0
+
+    def query(self, item: str) -> int:
+        return min(row[idx] for row, idx in zip(self._rows, self._indexes(item)))
+
+
+class TopKSketch:
+    """Approximate top-k heavy hitters backed by a Count-Min Sketch.
+
+    Memory is bounded by the sketch size plus ``k`` tracked candidates,
+    regardless of how many distinct items are seen.
+    """
+
+    def __init__(self, k: int, width: int = 4096, depth: int = 4) -> None:
+        self.k = k
+        self._sketch = CountMinSketch(width=width, depth=depth)
+        self._top: Dict[str, int] = {}
+        self._floor_item: str | None = None
+
+    def update(self, items: Iterable[str]) -> None:
+        top = self._top
+        for item in items:
+            estimate = self._sketch.add(item)
+            if item in top:
+                top[item] = estimate
+                if item == self._floor_item:
+                    self._floor_item = min(top, key=top.__getitem__)
+            elif len(top) < self.k:
+                top[item] = estimate
+                if self._floor_item is None or estimate < top[self._floor_item]:
+                    self._floor_item = item
+            elif estimate > top[self._floor_item]:  # type: ignore[index]
+                del top[self._floor_item]  # type: ignore[arg-type]
+                top[item] = estimate
+                self._floor_item = min(top, key=top.__getitem__)
+
+    def items(self) -> Dict[str, int]:
+        """Tracked items with their estimated counts."""
+        return dict(self._top)
+
+
+__all__ = ["CountMinSketch", "TopKSketch"]
@@ -5,14 +5,18 @@ Analyzes user's communication patterns across all corpora to extract
 unique voice fingerprints for authentic replication.
 """
 
+import hashlib
 import re
-import json
+from bisect import bisect_right
+from functools import cached_property
+from heapq import nlargest
+from operator import itemgetter
 from typing import Dict, List, Any, Optional, Tuple, Set
 from datetime import datetime
 from collections import Counter, defaultdict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 from mcg_agent.search.tools import personal_search, social_search, published_search
 from mcg_agent.search.connectors import PersonalSearchFilters, SocialSearchFilters, PublishedSearchFilters
@@ -20,6 +24,7 @@ from mcg_agent.security.personal_data_encryption import PersonalDataEncryption
 from mcg_agent.security.personal_voice_audit_trail import PersonalVoiceAuditTrail
 from mcg_agent.utils.exceptions import VoiceFingerprintError
 from mcg_agent.utils.audit import AuditLogger
+from mcg_agent.utils.sketch import TopKSketch
 
 
 @dataclass
@@ -33,6 +38,16 @@ class VoicePattern:
     context_examples: List[str]
 
 
+@dataclass
+class _CorpusStats:
+    """Raw counts gathered in a single pass over corpus content"""
+    word_counts: Counter = field(default_factory=Counter)
+    punctuation_counts: Counter = field(default_factory=Counter)
+    length_counts: Counter = field(default_factory=Counter)
+    total_chars: int = 0
+    total_sentences: int = 0
+
+
 class VoiceFingerprint(BaseModel):
     """Complete voice fingerprint for a user"""
     user_id: str = Field(description="User identifier")
@@ -64,6 +79,33 @@ class VoiceFingerprint(BaseModel):
     
     class Config:
         arbitrary_types_allowed = True
+    
+    @cached_property
+    def content_hash(self) -> str:
+        """Digest of the fingerprint content, computed once per instance.
+        
+        Regenerated fingerprints get a new hash, so caches keyed on it never
+        serve results derived from an older fingerprint.
+        """
+        return hashlib.blake2b(_FINGERPRINT_ADAPTER.dump_json(self), digest_size=16).hexdigest()
+
+
+_FINGERPRINT_ADAPTER = TypeAdapter(VoiceFingerprint)
+
+_WORD_FIND = re.compile(r'\b\w+\b').findall
+
+_SENTENCE_SPLIT = re.compile(r'[.!?]+').split
+
+_VOCAB_STOPWORDS = frozenset({
+    'that', 'this', 'with', 'have', 'will', 'been', 'from',
+    'they', 'know', 'want', 'good', 'much', 'some'
+})
+
+_PUNCTUATION_MARKS = ('.', '!', '?', ',', ';', ':', '-', '--')
+
+# Sentence word-count bucket edges: <8 short, <15 medium, <25 long, else very_long
+_LENGTH_EDGES = (8, 15, 25)
+_LENGTH_BUCKETS = ('short', 'medium', 'long', 'very_long')
 
 
 class VoiceFingerprintExtractor:
@@ -84,6 +126,11 @@ class VoiceFingerprintExtractor:
         self.max_patterns_per_type = 20
         self.confidence_threshold = 0.6
         
+        # Above this many documents, vocabulary is counted approximately in
+        # bounded memory instead of with an exact Counter
+        self.vocabulary_sketch_threshold = 10_000
+        self.vocabulary_top_n = 50
+        
     async def extract_voice_fingerprint(
         self, 
         user_id: str,
@@ -103,7 +150,7 @@ class VoiceFingerprintExtractor:
             if not corpus_access_permissions:
                 corpus_access_permissions = ["personal", "social", "published"]
                 
-            self.audit_logger.log_info(f"Starting voice fingerprint extraction for user {user_id}")
+            self.audit_logger.log_info("Starting voice fingerprint extraction for user %s", user_id)
             
             # Collect communication data from all accessible corpora
             communication_data = await self._collect_communication_data(
@@ -159,8 +206,9 @@ class VoiceFingerprintExtractor:
             )
             
             self.audit_logger.log_info(
-                f"Voice fingerprint extraction completed for user {user_id} "
-                f"with confidence {confidence_score:.2f}"
+                "Voice fingerprint extraction completed for user %s with confidence %.2f",
+                user_id,
+                confidence_score
             )
             
             return fingerprint
@@ -193,7 +241,7 @@ class VoiceFingerprintExtractor:
                 communication_data["published"] = published_data
                 
         except Exception as e:
-            self.audit_logger.log_error(f"Communication data collection failed: {str(e)}")
+            self.audit_logger.log_error("Communication data collection failed: %s", e)
             
         return communication_data
         
@@ -229,12 +277,12 @@ class VoiceFingerprintExtractor:
                         })
                         
                 except Exception as e:
-                    self.audit_logger.log_warning(f"Personal data collection failed for query '{query}': {str(e)}")
+                    self.audit_logger.log_warning("Personal data collection failed for query '%s': %s", query, e)
                     
             return personal_data[:50]  # Limit to 50 samples
             
         except Exception as e:
-            self.audit_logger.log_error(f"Personal data collection failed: {str(e)}")
+            self.audit_logger.log_error("Personal data collection failed: %s", e)
             return []
             
     async def _collect_social_data(self, user_id: str) -> List[Dict[str, Any]]:
@@ -269,12 +317,12 @@ class VoiceFingerprintExtractor:
                         })
                         
                 except Exception as e:
-                    self.audit_logger.log_warning(f"Social data collection failed for query '{query}': {str(e)}")
+                    self.audit_logger.log_warning("Social data collection failed for query '%s': %s", query, e)
                     
             return social_data[:50]  # Limit to 50 samples
             
         except Exception as e:
-            self.audit_logger.log_error(f"Social data collection failed: {str(e)}")
+            self.audit_logger.log_error("Social data collection failed: %s", e)
             return []
             
     async def _collect_published_data(self, user_id: str) -> List[Dict[str, Any]]:
@@ -309,12 +357,12 @@ class VoiceFingerprintExtractor:
                         })
                         
                 except Exception as e:
-                    self.audit_logger.log_warning(f"Published data collection failed for query '{query}': {str(e)}")
+                    self.audit_logger.log_warning("Published data collection failed for query '%s': %s", query, e)
                     
             return published_data[:50]  # Limit to 50 samples
             
         except Exception as e:
-            self.audit_logger.log_error(f"Published data collection failed: {str(e)}")
+            self.audit_logger.log_error("Published data collection failed: %s", e)
             return []
             
     async def _extract_voice_patterns(
@@ -344,7 +392,7 @@ class VoiceFingerprintExtractor:
                 voice_patterns[corpus_type] = filtered_patterns
                 
             except Exception as e:
-                self.audit_logger.log_error(f"Pattern extraction failed for {corpus_type}: {str(e)}")
+                self.audit_logger.log_error("Pattern extraction failed for %s: %s", corpus_type, e)
                 voice_patterns[corpus_type] = []
                 
         return voice_patterns
@@ -425,7 +473,7 @@ class VoiceFingerprintExtractor:
                     patterns.append(voice_pattern)
                     
         except Exception as e:
-            self.audit_logger.log_error(f"Conversational pattern extraction failed: {str(e)}")
+            self.audit_logger.log_error("Conversational pattern extraction failed: %s", e)
             
         return patterns
         
@@ -473,7 +521,7 @@ class VoiceFingerprintExtractor:
                     patterns.append(voice_pattern)
                     
         except Exception as e:
-            self.audit_logger.log_error(f"Transition pattern extraction failed: {str(e)}")
+            self.audit_logger.log_error("Transition pattern extraction failed: %s", e)
             
         return patterns
         
@@ -490,7 +538,7 @@ class VoiceFingerprintExtractor:
             # Extract phrases of 2-5 words that appear frequently
             for item in data:
                 content = item.get("content", "")
-                words = re.findall(r'\b\w+\b', content.lower())
+                words = _WORD_FIND(content.lower())
                 
                 # Generate n-grams (2-5 words)
                 for n in range(2, 6):
@@ -518,7 +566,7 @@ class VoiceFingerprintExtractor:
                     patterns.append(voice_pattern)
                     
         except Exception as e:
-            self.audit_logger.log_error(f"Expression pattern extraction failed: {str(e)}")
+            self.audit_logger.log_error("Expression pattern extraction failed: %s", e)
             
         return patterns
         
@@ -560,7 +608,7 @@ class VoiceFingerprintExtractor:
             return final_patterns
             
         except Exception as e:
-            self.audit_logger.log_error(f"Pattern filtering failed: {str(e)}")
+            self.audit_logger.log_error("Pattern filtering failed: %s", e)
             return patterns[:50]  # Fallback limit
             
     def _analyze_voice_characteristics(
@@ -598,7 +646,7 @@ class VoiceFingerprintExtractor:
             return characteristics
             
         except Exception as e:
-            self.audit_logger.log_error(f"Voice characteristics analysis failed: {str(e)}")
+            self.audit_logger.log_error("Voice characteristics analysis failed: %s", e)
             return {
                 "sentence_structures": [],
                 "transitions": [],
@@ -616,7 +664,7 @@ class VoiceFingerprintExtractor:
             structure_patterns = Counter()
             
             for content in content_list:
-                sentences = re.split(r'[.!?]+', content)
+                sentences = _SENTENCE_SPLIT(content)
                 
                 for sentence in sentences:
                     sentence = sentence.strip()
@@ -625,14 +673,16 @@ class VoiceFingerprintExtractor:
                         words = sentence.split()
                         length_category = "short" if len(words) < 10 else "medium" if len(words) < 20 else "long"
                         
+                        sentence_lower = sentence.lower()
+                        
                         # Check for question structure
-                        if sentence.lower().startswith(('what', 'how', 'why', 'when', 'where', 'who')):
+                        if sentence_lower.startswith(('what', 'how', 'why', 'when', 'where', 'who')):
                             structure_patterns[f"question_{length_category}"] += 1
                         # Check for conditional structure
-                        elif 'if' in sentence.lower():
+                        elif 'if' in sentence_lower:
                             structure_patterns[f"conditional_{length_category}"] += 1
                         # Check for compound structure
-                        elif any(conj in sentence.lower() for conj in ['and', 'but', 'or', 'however']):
+                        elif any(conj in sentence_lower for conj in ['and', 'but', 'or', 'however']):
                             structure_patterns[f"compound_{length_category}"] += 1
                         else:
                             structure_patterns[f"simple_{length_category}"] += 1
@@ -641,7 +691,7 @@ class VoiceFingerprintExtractor:
             structures = [struct for struct, count in structure_patterns.most_common(10)]
             
         except Exception as e:
-            self.audit_logger.log_error(f"Sentence structure analysis failed: {str(e)}")
+            self.audit_logger.log_error("Sentence structure analysis failed: %s", e)
             
         return structures
         
@@ -675,7 +725,7 @@ class VoiceFingerprintExtractor:
                 tone_distribution = {'neutral': 1.0}
                 
         except Exception as e:
-            self.audit_logger.log_error(f"Tone distribution analysis failed: {str(e)}")
+            self.audit_logger.log_error("Tone distribution analysis failed: %s", e)
             tone_distribution = {'neutral': 1.0}
             
         return tone_distribution
@@ -710,7 +760,7 @@ class VoiceFingerprintExtractor:
                 formality_distribution = {'moderate': 1.0}
                 
         except Exception as e:
-            self.audit_logger.log_error(f"Formality analysis failed: {str(e)}")
+            self.audit_logger.log_error("Formality analysis failed: %s", e)
             formality_distribution = {'moderate': 1.0}
             
         return formality_distribution
@@ -730,17 +780,18 @@ class VoiceFingerprintExtractor:
                 tone_indicators = Counter()
                 
                 for item in data:
-                    content = item.get("content", "")
-                    sentences = re.split(r'[.!?]+', content)
+                    # Lowercase once per document; word counts are unaffected by case
+                    content_lower = item.get("content", "").lower()
+                    sentences = _SENTENCE_SPLIT(content_lower)
                     
-                    for sentence in sentences:
-                        if sentence.strip():
-                            words = sentence.split()
+                    for sentence_lower in sentences:
+                        # A single split doubles as the blank-sentence check
+                        words = sentence_lower.split()
+                        if words:
                             avg_sentence_length += len(words)
                             total_sentences += 1
                             
                             # Count tone indicators
-                            sentence_lower = sentence.lower()
                             if any(word in sentence_lower for word in ['excited', 'love', 'amazing']):
                                 tone_indicators['enthusiastic'] += 1
                             elif any(word in sentence_lower for word in ['however', 'therefore']):
@@ -751,12 +802,12 @@ class VoiceFingerprintExtractor:
                     
                 adaptations[corpus_type] = {
                     "avg_sentence_length": avg_sentence_length,
-                    "dominant_tone": tone_indicators.most_common(1)[0][0] if tone_indicators else "neutral",
+                    "dominant_tone": max(tone_indicators, key=tone_indicators.get, default="neutral"),
                     "sample_size": len(data)
                 }
                 
         except Exception as e:
-            self.audit_logger.log_error(f"Audience adaptation analysis failed: {str(e)}")
+            self.audit_logger.log_error("Audience adaptation analysis failed: %s", e)
             
         return adaptations
         
@@ -771,14 +822,17 @@ class VoiceFingerprintExtractor:
                 for item in corpus_data:
                     all_content.append(item.get("content", ""))
                     
+            # Gather vocabulary, punctuation and sentence statistics in one pass
+            stats = self._collect_corpus_stats(all_content)
+            
             # Analyze vocabulary preferences
-            vocabulary = self._analyze_vocabulary_preferences(all_content)
+            vocabulary = self._analyze_vocabulary_preferences(stats)
             
             # Analyze punctuation patterns
-            punctuation = self._analyze_punctuation_patterns(all_content)
+            punctuation = self._analyze_punctuation_patterns(stats)
             
             # Analyze sentence length distribution
-            sentence_lengths = self._analyze_sentence_length_distribution(all_content)
+            sentence_lengths = self._analyze_sentence_length_distribution(stats)
             
             return {
                 "vocabulary": vocabulary,
@@ -787,105 +841,93 @@ class VoiceFingerprintExtractor:
             }
             
         except Exception as e:
-            self.audit_logger.log_error(f"Linguistic pattern analysis failed: {str(e)}")
+            self.audit_logger.log_error("Linguistic pattern analysis failed: %s", e)
             return {
                 "vocabulary": {},
                 "punctuation": {},
                 "sentence_lengths": {}
             }
             
-    def _analyze_vocabulary_preferences(self, content_list: List[str]) -> Dict[str, int]:
-        """Analyze vocabulary preferences"""
-        word_counts = Counter()
+    def _collect_corpus_stats(self, content_list: List[str]) -> _CorpusStats:
+        """Collect vocabulary, punctuation and sentence length counts in a single traversal"""
+        stats = _CorpusStats()
+        word_counts = stats.word_counts
+        punctuation_counts = stats.punctuation_counts
+        length_counts = stats.length_counts
+        
+        # Massive corpora: approximate top-N vocabulary with a Count-Min Sketch
+        vocabulary_sketch = None
+        if len(content_list) > self.vocabulary_sketch_threshold:
+            vocabulary_sketch = TopKSketch(self.vocabulary_top_n)
+        update_vocabulary = vocabulary_sketch.update if vocabulary_sketch else word_counts.update
+        
+        for content in content_list:
+            # Vocabulary: filter out common words while counting
+            update_vocabulary(
+                word for word in _WORD_FIND(content.lower())
+                if len(word) > 3 and word not in _VOCAB_STOPWORDS
+            )
+            
+            # Punctuation: count different punctuation marks
+            stats.total_chars += len(content)
+            for punct in _PUNCTUATION_MARKS:
+                punctuation_counts[punct] += content.count(punct)
+                
+            # Sentence lengths
+            for sentence in _SENTENCE_SPLIT(content):
+                # A single split doubles as the blank-sentence check
+                word_count = len(sentence.split())
+                if word_count:
+                    stats.total_sentences += 1
+                    length_counts[_LENGTH_BUCKETS[bisect_right(_LENGTH_EDGES, word_count)]] += 1
+                    
+        if vocabulary_sketch:
+            word_counts.update(vocabulary_sketch.items())
+            
+        return stats
         
+    def _analyze_vocabulary_preferences(self, stats: _CorpusStats) -> Dict[str, int]:
+        """Analyze vocabulary preferences"""
         try:
-            for content in content_list:
-                words = re.findall(r'\b\w+\b', content.lower())
-                
-                # Filter out common words
-                filtered_words = [
-                    word for word in words 
-                    if len(word) > 3 and word not in {
-                        'that', 'this', 'with', 'have', 'will', 'been', 'from', 
-                        'they', 'know', 'want', 'been', 'good', 'much', 'some'
-                    }
-                ]
-                
-                word_counts.update(filtered_words)
-                
-            # Return top vocabulary preferences
-            return dict(word_counts.most_common(50))
+            # Return top vocabulary preferences (bounded heap, not a full sort)
+            return dict(nlargest(self.vocabulary_top_n, stats.word_counts.items(), key=itemgetter(1)))
             
         except Exception as e:
-            self.audit_logger.log_error(f"Vocabulary analysis failed: {str(e)}")
+            self.audit_logger.log_error("Vocabulary analysis failed: %s", e)
             return {}
             
-    def _analyze_punctuation_patterns(self, content_list: List[str]) -> Dict[str, float]:
+    def _analyze_punctuation_patterns(self, stats: _CorpusStats) -> Dict[str, float]:
         """Analyze punctuation usage patterns"""
-        punctuation_counts = Counter()
-        total_chars = 0
-        
         try:
-            for content in content_list:
-                total_chars += len(content)
-                
-                # Count different punctuation marks
-                punctuation_counts['.'] += content.count('.')
-                punctuation_counts['!'] += content.count('!')
-                punctuation_counts['?'] += content.count('?')
-                punctuation_counts[','] += content.count(',')
-                punctuation_counts[';'] += content.count(';')
-                punctuation_counts[':'] += content.count(':')
-                punctuation_counts['-'] += content.count('-')
-                punctuation_counts['--'] += content.count('--')
-                
             # Convert to ratios
-            if total_chars > 0:
+            if stats.total_chars > 0:
                 punctuation_patterns = {
-                    punct: count / total_chars for punct, count in punctuation_counts.items()
+                    punct: count / stats.total_chars
+                    for punct, count in stats.punctuation_counts.items()
                 }
             else:
                 punctuation_patterns = {}
                 
         except Exception as e:
-            self.audit_logger.log_error(f"Punctuation analysis failed: {str(e)}")
+            self.audit_logger.log_error("Punctuation analysis failed: %s", e)
             punctuation_patterns = {}
             
         return punctuation_patterns
         
-    def _analyze_sentence_length_distribution(self, content_list: List[str]) -> Dict[str, float]:
+    def _analyze_sentence_length_distribution(self, stats: _CorpusStats) -> Dict[str, float]:
         """Analyze sentence length preferences"""
-        length_counts = Counter()
-        total_sentences = 0
-        
         try:
-            for content in content_list:
-                sentences = re.split(r'[.!?]+', content)
-                
-                for sentence in sentences:
-                    if sentence.strip():
-                        word_count = len(sentence.split())
-                        total_sentences += 1
-                        
-                        if word_count < 8:
-                            length_counts['short'] += 1
-                        elif word_count < 15:
-                            length_counts['medium'] += 1
-                        elif word_count < 25:
-                            length_counts['long'] += 1
-                        else:
-                            length_counts['very_long'] += 1
-                            
             # Convert to distribution
-            if total_sentences > 0:
+            if stats.total_sentences > 0:
                 length_distribution = {
-                    length: count / total_sentences for length, count in length_counts.items()
+                    length: count / stats.total_sentences
+                    for length, count in stats.length_counts.items()
                 }
             else:
                 length_distribution = {'medium': 1.0}
                 
         except Exception as e:
-            self.audit_logger.log_error(f"Sentence length analysis failed: {str(e)}")
+            self.audit_logger.log_error("Sentence length analysis failed: %s", e)
             length_distribution = {'medium': 1.0}
             
         return length_distribution
@@ -897,27 +939,33 @@ class VoiceFingerprintExtractor:
     ) -> float:
         """Calculate overall confidence score for the fingerprint"""
         try:
+            # Aggregate corpus statistics in a single pass
+            total_items = 0
+            corpus_count = 0
+            for data in communication_data.values():
+                if data:
+                    corpus_count += 1
+                    total_items += len(data)
+
+            # Aggregate pattern statistics in a single pass
+            total_patterns = 0
+            confidence_sum = 0.0
+            for patterns in voice_patterns.values():
+                total_patterns += len(patterns)
+                for pattern in patterns:
+                    confidence_sum += pattern.confidence_score
+
             # Data coverage score
-            total_items = sum(len(data) for data in communication_data.values())
             coverage_score = min(total_items / 50.0, 1.0)  # Target 50 items
-            
+
             # Pattern quality score
-            total_patterns = sum(len(patterns) for patterns in voice_patterns.values())
             pattern_score = min(total_patterns / 30.0, 1.0)  # Target 30 patterns
-            
+
             # Corpus diversity score
-            corpus_count = len([data for data in communication_data.values() if data])
             diversity_score = corpus_count / 3.0  # 3 corpora available
-            
+
             # Average pattern confidence
-            all_patterns = []
-            for patterns in voice_patterns.values():
-                all_patterns.extend(patterns)
-                
-            if all_patterns:
-                avg_pattern_confidence = sum(p.confidence_score for p in all_patterns) / len(all_patterns)
-            else:
-                avg_pattern_confidence = 0.5
+            avg_pattern_confidence = confidence_sum / total_patterns if total_patterns else 0.5
                 
             # Overall confidence
             confidence = (
@@ -930,28 +978,31 @@ class VoiceFingerprintExtractor:
             return min(confidence, 1.0)
             
         except Exception as e:
-            self.audit_logger.log_error(f"Confidence calculation failed: {str(e)}")
+            self.audit_logger.log_error("Confidence calculation failed: %s", e)
             return 0.5
             
     async def _store_encrypted_fingerprint(self, fingerprint: VoiceFingerprint) -> None:
         """Store encrypted voice fingerprint"""
         try:
-            # Convert fingerprint to JSON
-            fingerprint_data = fingerprint.dict()
-            fingerprint_json = json.dumps(fingerprint_data, default=str)
-            
+            # Serialize straight to UTF-8 bytes (Pydantic handles datetimes natively)
+            fingerprint_bytes = _FINGERPRINT_ADAPTER.dump_json(fingerprint)
+
             # Encrypt the fingerprint
-            encrypted_data = self.encryption.encrypt_personal_data(
-                fingerprint_json,
-                f"voice_fingerprint_{fingerprint.user_id}"
+            encrypted_data = self.encryption.encrypt_personal_data_bytes(
+                fingerprint_bytes,
+                f"voice_fingerprint_{fingerprint.user_id}",
+                compress=True
             )
             
             # Store encrypted fingerprint (implementation would depend on storage backend)
             # For now, just log that it would be stored
-            self.audit_logger.log_info(f"Voice fingerprint encrypted and ready for storage for user {fingerprint.user_id}")
+            self.audit_logger.log_info(
+                "Voice fingerprint encrypted and ready for storage for user %s",
+                fingerprint.user_id
+            )
             
         except Exception as e:
-            self.audit_logger.log_error(f"Fingerprint storage failed: {str(e)}")
+            self.audit_logger.log_error("Fingerprint storage failed: %s", e)
 
 
 __all__ = [
@@ -5,23 +5,61 @@ This module provides sophisticated voice replication capabilities including:
 - Voice learning and evolution tracking
 - Voice consistency monitoring and drift detection
 - Voice quality assurance and improvement
+
+Protocol classes are imported lazily on first attribute access (PEP 562) so
+importing the package does not pay for submodules that are never used.
 """
 
-from .protocols.voice_adaptation_protocol import (
-    VoiceAdaptationProtocol,
-    ContextAnalysisProtocol,
-    AdaptationStrategyProtocol
-)
-from .protocols.voice_learning_protocol import (
-    VoiceLearningProtocol,
-    FeedbackProcessingProtocol,
-    EvolutionTrackingProtocol
-)
-from .protocols.voice_monitoring_protocol import (
-    VoiceMonitoringProtocol,
-    ConsistencyCheckProtocol,
-    DriftDetectionProtocol
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .protocols.voice_adaptation_protocol import (
+        VoiceAdaptationProtocol,
+        ContextAnalysisProtocol,
+        AdaptationStrategyProtocol
+    )
+    from .protocols.voice_learning_protocol import (
+        VoiceLearningProtocol,
+        FeedbackProcessingProtocol,
+        EvolutionTrackingProtocol
+    )
+    from .protocols.voice_monitoring_protocol import (
+        VoiceMonitoringProtocol,
+        ConsistencyCheckProtocol,
+        DriftDetectionProtocol
+    )
+
+_LAZY_IMPORTS = {
+    # Voice Adaptation Protocols
+    "VoiceAdaptationProtocol": ".protocols.voice_adaptation_protocol",
+    "ContextAnalysisProtocol": ".protocols.voice_adaptation_protocol",
+    "AdaptationStrategyProtocol": ".protocols.voice_adaptation_protocol",
+
+    # Voice Learning Protocols
+    "VoiceLearningProtocol": ".protocols.voice_learning_protocol",
+    "FeedbackProcessingProtocol": ".protocols.voice_learning_protocol",
+    "EvolutionTrackingProtocol": ".protocols.voice_learning_protocol",
+
+    # Voice Monitoring Protocols
+    "VoiceMonitoringProtocol": ".protocols.voice_monitoring_protocol",
+    "ConsistencyCheckProtocol": ".protocols.voice_monitoring_protocol",
+    "DriftDetectionProtocol": ".protocols.voice_monitoring_protocol"
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     # Voice Adaptation Protocols
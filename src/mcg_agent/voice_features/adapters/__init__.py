@@ -1,8 +1,35 @@
-"""Voice adaptation components implementing dynamic voice modification."""
+"""Voice adaptation components implementing dynamic voice modification.
+
+Adapters are imported lazily on first attribute access (PEP 562).
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .dynamic_voice_adapter import DynamicVoiceAdapter
+    from .context_voice_adapter import ContextVoiceAdapter
+    from .audience_voice_adapter import AudienceVoiceAdapter
+
+_LAZY_IMPORTS = {
+    "DynamicVoiceAdapter": ".dynamic_voice_adapter",
+    "ContextVoiceAdapter": ".context_voice_adapter",
+    "AudienceVoiceAdapter": ".audience_voice_adapter"
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
 
-from .dynamic_voice_adapter import DynamicVoiceAdapter
-from .context_voice_adapter import ContextVoiceAdapter
-from .audience_voice_adapter import AudienceVoiceAdapter
 
 __all__ = [
     "DynamicVoiceAdapter",
@@ -1,7 +1,12 @@
 """Audience voice adapter for audience-specific voice adaptation."""
 
 import logging
-from typing import Dict, List, Optional, Any, Tuple
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Any, Tuple
 from datetime import datetime
 
 from ..protocols.voice_adaptation_protocol import AdaptationContext, ContextType
@@ -10,6 +15,148 @@ from ...voice.voice_fingerprint_applicator import VoiceFingerprintApplicator
 
 logger = logging.getLogger(__name__)
 
+# Related terms that indicate each audience category (read-only)
+_CATEGORY_TERMS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    'executive': ('ceo', 'director', 'vp', 'president', 'chief', 'head'),
+    'technical': ('engineer', 'developer', 'architect', 'programmer', 'tech'),
+    'creative': ('designer', 'artist', 'creative', 'marketing', 'content'),
+    'customer': ('client', 'user', 'customer', 'buyer', 'consumer'),
+    'colleague': ('team', 'colleague', 'coworker', 'peer', 'staff'),
+    'friend': ('friend', 'buddy', 'pal', 'mate'),
+    'family': ('family', 'mom', 'dad', 'sister', 'brother', 'relative')
+})
+
+
+_EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+
+# Profile keys carried into tone adjustments and style modifications
+_TONE_KEYS: Tuple[str, ...] = ('warmth', 'directness', 'enthusiasm', 'helpfulness')
+_STYLE_KEYS: Tuple[str, ...] = ('technical_depth', 'expressiveness', 'precision', 'detail_level')
+
+# Presized fallback target context; copied per call, never mutated
+_FALLBACK_TARGET_CONTEXT: Dict[str, Any] = {
+    'strategy': 'preserve_original',
+    'fallback_reason': 'audience_adaptation_error',
+    'context_type': None
+}
+
+
+def _freeze(value: Any) -> Any:
+    """Wrap nested dicts in read-only views so cached results can be shared."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    return value
+
+
+_BASE_PREFERENCES: Dict[str, Any] = {
+    'communication_style': 'balanced',
+    'formality_preference': 0.5,
+    'detail_preference': 0.5,
+    'interaction_style': 'professional',
+    'response_expectations': {}
+}
+
+_DEFAULT_PREFERENCES: Mapping[str, Any] = _freeze(_BASE_PREFERENCES)
+
+# Communication styles in priority order: (trigger pattern, preferences).
+# Patterns match terms as plain substrings, like the original ``in`` checks.
+_PREFERENCE_STYLES: Tuple[Tuple[re.Pattern, Mapping[str, Any]], ...] = tuple(
+    (re.compile('|'.join(map(re.escape, terms))), _freeze({**_BASE_PREFERENCES, **style}))
+    for terms, style in (
+        (('executive', 'ceo', 'director', 'vp'), {
+            'communication_style': 'executive',
+            'formality_preference': 0.9,
+            'detail_preference': 0.3,  # High-level overview preferred
+            'interaction_style': 'respectful',
+            'response_expectations': {
+                'brevity': 0.9,
+                'action_orientation': 0.9,
+                'strategic_focus': 0.8
+            }
+        }),
+        (('engineer', 'developer', 'technical', 'architect'), {
+            'communication_style': 'technical',
+            'formality_preference': 0.4,
+            'detail_preference': 0.9,  # Technical details appreciated
+            'interaction_style': 'direct',
+            'response_expectations': {
+                'precision': 0.9,
+                'technical_depth': 0.9,
+                'evidence_based': 0.8
+            }
+        }),
+        (('customer', 'client', 'user'), {
+            'communication_style': 'service',
+            'formality_preference': 0.6,
+            'detail_preference': 0.7,
+            'interaction_style': 'helpful',
+            'response_expectations': {
+                'clarity': 0.9,
+                'helpfulness': 0.9,
+                'solution_focus': 0.8
+            }
+        }),
+        (('friend', 'buddy', 'pal'), {
+            'communication_style': 'friendly',
+            'formality_preference': 0.2,
+            'detail_preference': 0.5,
+            'interaction_style': 'casual',
+            'response_expectations': {
+                'warmth': 0.9,
+                'personal_touch': 0.8,
+                'humor_allowance': 0.7
+            }
+        }),
+    )
+)
+
+
+@lru_cache(maxsize=1024)
+def _analyze_preferences_impl(audience_lower: str) -> Mapping[str, Any]:
+    """Audience preference analysis for a lowercased audience description."""
+    for pattern, preferences in _PREFERENCE_STYLES:
+        if pattern.search(audience_lower):
+            return preferences
+    return _DEFAULT_PREFERENCES
+
+
+@dataclass(slots=True, frozen=True)
+class AudienceAnalysis:
+    """Audience category inferred from the adaptation context."""
+    primary_category: str
+    confidence: float
+    characteristics: Mapping[str, Any]
+
+
+@dataclass(slots=True, frozen=True)
+class AudienceProfile:
+    """Read-only audience traits with the analysis that selected them."""
+    category: str
+    analysis_confidence: float
+    traits: Mapping[str, Any]
+    
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            **self.traits,
+            'category': self.category,
+            'analysis_confidence': self.analysis_confidence
+        }
+
+
+@dataclass(slots=True, frozen=True)
+class AdaptationFactors:
+    """Combined audience, relationship and context adaptation factors."""
+    formality_level: float
+    tone_adjustments: Dict[str, Any]
+    style_modifications: Dict[str, Any]
+    
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'formality_level': self.formality_level,
+            'tone_adjustments': self.tone_adjustments,
+            'style_modifications': self.style_modifications
+        }
+
 
 class AudienceVoiceAdapter:
     """
@@ -108,6 +255,63 @@ class AudienceVoiceAdapter:
                 'emotional_openness': 0.9
             }
         }
+        
+        # Shared read-only views handed to the adaptation helpers
+        self._audience_profiles_ro: Dict[str, Mapping[str, Any]] = {
+            category: MappingProxyType(profile)
+            for category, profile in self.audience_profiles.items()
+        }
+        self._relationship_adjustments_ro: Dict[str, Mapping[str, Any]] = {
+            level: MappingProxyType(adjustments)
+            for level, adjustments in self.relationship_adjustments.items()
+        }
+        
+        # Inverted index: token -> ((category, weight), ...). A category name
+        # scores 1.0 and each related term 0.5, summed when a token is both.
+        term_weights: Dict[str, Dict[str, float]] = {}
+        for category in self.audience_profiles:
+            weights = term_weights.setdefault(category, {})
+            weights[category] = weights.get(category, 0.0) + 1.0
+            for term in _CATEGORY_TERMS.get(category, ()):
+                weights = term_weights.setdefault(term, {})
+                weights[category] = weights.get(category, 0.0) + 0.5
+        self._audience_term_index: Dict[str, Tuple[Tuple[str, float], ...]] = {
+            term: tuple(weights.items()) for term, weights in term_weights.items()
+        }
+        
+        # One multi-term scan over the audience: finds indexed terms standing
+        # as whole letter-runs, optionally followed by a plural "s"
+        self._audience_term_scan = re.compile(
+            r'(?<![a-z])('
+            + '|'.join(map(re.escape, sorted(self._audience_term_index, key=len, reverse=True)))
+            + r')s?(?![a-z])'
+        ).findall
+        
+        # Precomputed analyses for audiences that are exactly a category name
+        self._exact_audience_analyses: Dict[str, AudienceAnalysis] = {
+            category: self._score_audience(category)
+            for category in self.audience_profiles
+        }
+        
+        # Relationship-independent voice adjustments per audience category
+        self._voice_adjustment_templates: Dict[str, Mapping[str, Any]] = {
+            category: self._build_voice_adjustment_template(category, profile)
+            for category, profile in self.audience_profiles.items()
+        }
+        
+        # Precombined (base formality, tone, style) per (category, relationship);
+        # only the context formality blend is left for each request
+        self._factor_table: Dict[Tuple[str, Optional[str]], Tuple[float, Dict[str, Any], Dict[str, Any]]] = {
+            (category, relationship): self._precombine_factors(
+                self.audience_profiles.get(category, {}),
+                self.relationship_adjustments.get(relationship, {})
+            )
+            for category in (*self.audience_profiles, 'general')
+            for relationship in (*self.relationship_adjustments, None)
+        }
+        
+        # Memoized voice adjustments; profiles are fixed after construction
+        self._cached_voice_adjustments = lru_cache(maxsize=256)(self._build_voice_adjustments)
     
     async def adapt_for_audience(
         self,
@@ -125,44 +329,48 @@ class AudienceVoiceAdapter:
             Adapted voice context
         """
         try:
+            # Lowercase the audience once and share it with the helpers
+            audience_lower = (context.audience or "").lower()
+            
             # Analyze audience characteristics
-            audience_analysis = await self._analyze_audience(context)
+            audience_analysis = self._analyze_audience(context, audience_lower)
             
             # Get audience profile
-            audience_profile = await self._get_audience_profile(audience_analysis)
+            audience_profile = self._get_audience_profile(audience_analysis)
             
             # Apply relationship adjustments
-            relationship_adjustments = await self._get_relationship_adjustments(context)
+            relationship_adjustments = self._get_relationship_adjustments(context)
             
             # Combine audience and relationship factors
-            adaptation_factors = await self._combine_adaptation_factors(
+            adaptation_factors = self._combine_adaptation_factors(
                 audience_profile, relationship_adjustments, context
             )
+            adaptation_factors_dict = adaptation_factors.as_dict()
             
             # Apply voice adaptation
             adapted_context = await self.voice_applicator.apply_voice_patterns(
                 voice_fingerprint,
                 target_context={
                     'strategy': 'audience_adaptation',
-                    'audience_profile': audience_profile,
-                    'relationship_factors': relationship_adjustments,
-                    'adaptation_factors': adaptation_factors,
+                    'audience_profile': audience_profile.as_dict(),
+                    'relationship_factors': dict(relationship_adjustments),
+                    'adaptation_factors': adaptation_factors_dict,
                     'context_type': context.context_type.value,
-                    'formality_override': adaptation_factors.get('formality_level'),
-                    'tone_adjustments': adaptation_factors.get('tone_adjustments', {}),
-                    'style_modifications': adaptation_factors.get('style_modifications', {})
+                    'formality_override': adaptation_factors.formality_level,
+                    'tone_adjustments': adaptation_factors.tone_adjustments,
+                    'style_modifications': adaptation_factors.style_modifications
                 }
             )
             
             # Add audience-specific metadata
             adapted_context['audience_adaptation'] = {
-                'target_audience': audience_analysis.get('primary_category'),
+                'target_audience': audience_analysis.primary_category,
                 'relationship_level': context.relationship_level,
-                'adaptation_confidence': audience_analysis.get('confidence', 0.8),
-                'key_adjustments': list(adaptation_factors.keys())
+                'adaptation_confidence': audience_analysis.confidence,
+                'key_adjustments': list(adaptation_factors_dict)
             }
             
-            logger.debug(f"Audience adaptation completed for: {audience_analysis.get('primary_category')}")
+            logger.debug(f"Audience adaptation completed for: {audience_analysis.primary_category}")
             return adapted_context
             
         except Exception as e:
@@ -170,14 +378,17 @@ class AudienceVoiceAdapter:
             # Return fallback adaptation
             return await self._create_fallback_audience_adaptation(voice_fingerprint, context)
     
-    async def analyze_audience_preferences(
+    def analyze_audience_preferences(
         self,
         audience_description: str,
         context: AdaptationContext
-    ) -> Dict[str, Any]:
+    ) -> Mapping[str, Any]:
         """
         Analyze audience preferences and communication style.
         
+        Results are memoized by lowercased description and returned as
+        read-only mappings shared between callers.
+        
         Args:
             audience_description: Description of the target audience
             context: Adaptation context
@@ -185,76 +396,19 @@ class AudienceVoiceAdapter:
         Returns:
             Audience preference analysis
         """
-        audience_lower = audience_description.lower()
-        
-        preferences = {
-            'communication_style': 'balanced',
-            'formality_preference': 0.5,
-            'detail_preference': 0.5,
-            'interaction_style': 'professional',
-            'response_expectations': {}
-        }
-        
-        # Analyze communication style preferences
-        if any(term in audience_lower for term in ['executive', 'ceo', 'director', 'vp']):
-            preferences.update({
-                'communication_style': 'executive',
-                'formality_preference': 0.9,
-                'detail_preference': 0.3,  # High-level overview preferred
-                'interaction_style': 'respectful',
-                'response_expectations': {
-                    'brevity': 0.9,
-                    'action_orientation': 0.9,
-                    'strategic_focus': 0.8
-                }
-            })
-        elif any(term in audience_lower for term in ['engineer', 'developer', 'technical', 'architect']):
-            preferences.update({
-                'communication_style': 'technical',
-                'formality_preference': 0.4,
-                'detail_preference': 0.9,  # Technical details appreciated
-                'interaction_style': 'direct',
-                'response_expectations': {
-                    'precision': 0.9,
-                    'technical_depth': 0.9,
-                    'evidence_based': 0.8
-                }
-            })
-        elif any(term in audience_lower for term in ['customer', 'client', 'user']):
-            preferences.update({
-                'communication_style': 'service',
-                'formality_preference': 0.6,
-                'detail_preference': 0.7,
-                'interaction_style': 'helpful',
-                'response_expectations': {
-                    'clarity': 0.9,
-                    'helpfulness': 0.9,
-                    'solution_focus': 0.8
-                }
-            })
-        elif any(term in audience_lower for term in ['friend', 'buddy', 'pal']):
-            preferences.update({
-                'communication_style': 'friendly',
-                'formality_preference': 0.2,
-                'detail_preference': 0.5,
-                'interaction_style': 'casual',
-                'response_expectations': {
-                    'warmth': 0.9,
-                    'personal_touch': 0.8,
-                    'humor_allowance': 0.7
-                }
-            })
-        
-        return preferences
+        return _analyze_preferences_impl(audience_description.lower())
     
-    async def get_audience_voice_adjustments(
+    def get_audience_voice_adjustments(
         self,
         audience_category: str,
         relationship_level: Optional[str] = None
-    ) -> Dict[str, Any]:
+    ) -> Mapping[str, Any]:
         """
         Get specific voice adjustments for audience category.
         
+        Results are memoized per (category, relationship) and returned as
+        read-only mappings shared between callers.
+        
         Args:
             audience_category: Category of the audience
             relationship_level: Relationship level with audience
@@ -262,13 +416,35 @@ class AudienceVoiceAdapter:
         Returns:
             Voice adjustment parameters
         """
-        # Get base audience profile
-        base_profile = self.audience_profiles.get(audience_category, {})
-        
-        # Get relationship adjustments
+        return self._cached_voice_adjustments(audience_category, relationship_level)
+    
+    def _build_voice_adjustments(
+        self,
+        audience_category: str,
+        relationship_level: Optional[str]
+    ) -> Mapping[str, Any]:
+        """Build voice adjustments for an audience category and relationship."""
+        template = self._voice_adjustment_templates.get(audience_category)
+        if template is None:
+            template = self._build_voice_adjustment_template(audience_category, {})
+        
+        # Only the formality level depends on the relationship
         relationship_adj = self.relationship_adjustments.get(relationship_level, {})
+        if 'formality_boost' not in relationship_adj:
+            return template
         
-        # Combine adjustments
+        voice_adjustments = dict(template)
+        voice_adjustments['formality_level'] = min(1.0,
+            template['formality_level'] + relationship_adj['formality_boost']
+        )
+        return MappingProxyType(voice_adjustments)
+    
+    def _build_voice_adjustment_template(
+        self,
+        audience_category: str,
+        base_profile: Dict[str, Any]
+    ) -> Mapping[str, Any]:
+        """Build the relationship-independent voice adjustments for a category."""
         voice_adjustments = {
             'formality_level': base_profile.get('formality_level', 0.5),
             'tone_adjustments': {},
@@ -276,12 +452,6 @@ class AudienceVoiceAdapter:
             'vocabulary_adjustments': {}
         }
         
-        # Apply relationship adjustments
-        if 'formality_boost' in relationship_adj:
-            voice_adjustments['formality_level'] = min(1.0, 
-                voice_adjustments['formality_level'] + relationship_adj['formality_boost']
-            )
-        
         # Tone adjustments based on audience
         if 'warmth' in base_profile:
             voice_adjustments['tone_adjustments']['warmth'] = base_profile['warmth']
@@ -309,128 +479,124 @@ class AudienceVoiceAdapter:
             voice_adjustments['vocabulary_adjustments']['casual_language'] = 0.9
             voice_adjustments['vocabulary_adjustments']['colloquialisms'] = 0.7
         
-        return voice_adjustments
+        return _freeze(voice_adjustments)
     
     # Private helper methods
     
-    async def _analyze_audience(self, context: AdaptationContext) -> Dict[str, Any]:
-        """Analyze audience from context information."""
-        analysis = {
-            'primary_category': 'general',
-            'confidence': 0.5,
-            'characteristics': {},
-            'inferred_preferences': {}
-        }
-        
-        if not context.audience:
-            return analysis
+    def _analyze_audience(
+        self,
+        context: AdaptationContext,
+        audience_lower: str
+    ) -> AudienceAnalysis:
+        """Analyze audience from context information.
         
-        audience_lower = context.audience.lower()
+        ``audience_lower`` is the already-lowercased ``context.audience``.
+        """
+        if not audience_lower:
+            return AudienceAnalysis('general', 0.5, _EMPTY_MAPPING)
         
-        # Categorize audience
-        category_scores = {}
-        for category in self.audience_profiles.keys():
-            score = 0
-            if category in audience_lower:
-                score += 1.0
-            
-            # Check for related terms
-            category_terms = {
-                'executive': ['ceo', 'director', 'vp', 'president', 'chief', 'head'],
-                'technical': ['engineer', 'developer', 'architect', 'programmer', 'tech'],
-                'creative': ['designer', 'artist', 'creative', 'marketing', 'content'],
-                'customer': ['client', 'user', 'customer', 'buyer', 'consumer'],
-                'colleague': ['team', 'colleague', 'coworker', 'peer', 'staff'],
-                'friend': ['friend', 'buddy', 'pal', 'mate'],
-                'family': ['family', 'mom', 'dad', 'sister', 'brother', 'relative']
-            }
-            
-            related_terms = category_terms.get(category, [])
-            for term in related_terms:
-                if term in audience_lower:
-                    score += 0.5
-            
-            if score > 0:
-                category_scores[category] = score
+        # Canonical category names resolve without scoring
+        exact = self._exact_audience_analyses.get(audience_lower)
+        if exact is not None:
+            return exact
         
-        if category_scores:
-            primary_category = max(category_scores, key=category_scores.get)
-            analysis['primary_category'] = primary_category
-            analysis['confidence'] = min(1.0, category_scores[primary_category] / 2.0)
+        return self._score_audience(audience_lower)
+    
+    def _score_audience(self, audience_lower: str) -> AudienceAnalysis:
+        """Score audience categories by the terms found in the audience."""
+        primary_category = 'general'
+        confidence = 0.5
+        
+        # Categorize audience; scores start in profile order so ties go to
+        # the earlier category regardless of match order
+        category_scores = dict.fromkeys(self.audience_profiles, 0.0)
+        term_index = self._audience_term_index
+        for term in set(self._audience_term_scan(audience_lower)):
+            for category, weight in term_index[term]:
+                category_scores[category] += weight
+        
+        best_category, best_score = max(category_scores.items(), key=itemgetter(1))
+        if best_score > 0:
+            primary_category = best_category
+            confidence = min(1.0, best_score / 2.0)
         
         # Extract characteristics
-        analysis['characteristics'] = self.audience_profiles.get(
-            analysis['primary_category'], {}
-        ).copy()
+        characteristics = self._audience_profiles_ro.get(primary_category, _EMPTY_MAPPING)
         
-        return analysis
+        return AudienceAnalysis(primary_category, confidence, characteristics)
     
-    async def _get_audience_profile(self, audience_analysis: Dict[str, Any]) -> Dict[str, Any]:
+    def _get_audience_profile(self, audience_analysis: AudienceAnalysis) -> AudienceProfile:
         """Get detailed audience profile."""
-        primary_category = audience_analysis.get('primary_category', 'general')
-        base_profile = self.audience_profiles.get(primary_category, {}).copy()
-        
-        # Add analysis metadata
-        base_profile['category'] = primary_category
-        base_profile['analysis_confidence'] = audience_analysis.get('confidence', 0.5)
-        
-        return base_profile
+        return AudienceProfile(
+            category=audience_analysis.primary_category,
+            analysis_confidence=audience_analysis.confidence,
+            traits=audience_analysis.characteristics
+        )
     
-    async def _get_relationship_adjustments(self, context: AdaptationContext) -> Dict[str, Any]:
-        """Get relationship-based adjustments."""
+    def _get_relationship_adjustments(self, context: AdaptationContext) -> Mapping[str, Any]:
+        """Get read-only relationship-based adjustments."""
         if not context.relationship_level:
-            return {}
+            return _EMPTY_MAPPING
         
-        return self.relationship_adjustments.get(context.relationship_level, {}).copy()
+        return self._relationship_adjustments_ro.get(context.relationship_level, _EMPTY_MAPPING)
     
-    async def _combine_adaptation_factors(
+    def _combine_adaptation_factors(
         self,
-        audience_profile: Dict[str, Any],
-        relationship_adjustments: Dict[str, Any],
+        audience_profile: AudienceProfile,
+        relationship_adjustments: Mapping[str, Any],
         context: AdaptationContext
-    ) -> Dict[str, Any]:
+    ) -> AdaptationFactors:
         """Combine all adaptation factors."""
-        factors = {}
-        
-        # Base formality from audience profile
-        base_formality = audience_profile.get('formality_level', 0.5)
-        
-        # Apply relationship adjustments
-        if 'formality_boost' in relationship_adjustments:
-            base_formality += relationship_adjustments['formality_boost']
+        # Audience and relationship parts are precombined per category pair;
+        # unknown relationship levels carry no adjustments, same as None
+        relationship_level = context.relationship_level
+        if relationship_level not in self.relationship_adjustments:
+            relationship_level = None
+        entry = self._factor_table.get((audience_profile.category, relationship_level))
+        if entry is None:
+            entry = self._precombine_factors(audience_profile.traits, relationship_adjustments)
+        base_formality, tone_adjustments, style_modifications = entry
         
         # Apply context formality if available
         if context.formality_level is not None:
             # Blend context and audience formality
             base_formality = (base_formality + context.formality_level) / 2
         
-        factors['formality_level'] = max(0.0, min(1.0, base_formality))
+        return AdaptationFactors(
+            formality_level=max(0.0, min(1.0, base_formality)),
+            tone_adjustments=dict(tone_adjustments),
+            style_modifications=dict(style_modifications)
+        )
+    
+    def _precombine_factors(
+        self,
+        audience_profile: Mapping[str, Any],
+        relationship_adjustments: Mapping[str, Any]
+    ) -> Tuple[float, Dict[str, Any], Dict[str, Any]]:
+        """Combine the context-independent audience and relationship factors."""
+        # Base formality from audience profile
+        base_formality = audience_profile.get('formality_level', 0.5)
         
-        # Tone adjustments
-        tone_adjustments = {}
+        # Apply relationship adjustments
+        if 'formality_boost' in relationship_adjustments:
+            base_formality += relationship_adjustments['formality_boost']
         
-        # From audience profile
-        for key in ['warmth', 'directness', 'enthusiasm', 'helpfulness']:
-            if key in audience_profile:
-                tone_adjustments[key] = audience_profile[key]
+        # Tone adjustments from audience profile
+        tone_adjustments = {
+            key: audience_profile[key] for key in _TONE_KEYS if key in audience_profile
+        }
         
         # From relationship adjustments
         if 'warmth_boost' in relationship_adjustments:
             current_warmth = tone_adjustments.get('warmth', 0.5)
             tone_adjustments['warmth'] = min(1.0, current_warmth + relationship_adjustments['warmth_boost'])
         
-        factors['tone_adjustments'] = tone_adjustments
-        
         # Style modifications
-        style_modifications = {}
-        
-        for key in ['technical_depth', 'expressiveness', 'precision', 'detail_level']:
-            if key in audience_profile:
-                style_modifications[key] = audience_profile[key]
-        
-        factors['style_modifications'] = style_modifications
+        style_modifications = {
+            key: audience_profile[key] for key in _STYLE_KEYS if key in audience_profile
+        }
         
-        return factors
+        return base_formality, tone_adjustments, style_modifications
     
     async def _create_fallback_audience_adaptation(
         self,
@@ -438,11 +604,9 @@ class AudienceVoiceAdapter:
         context: AdaptationContext
     ) -> Dict[str, Any]:
         """Create fallback audience adaptation on error."""
+        target_context = _FALLBACK_TARGET_CONTEXT.copy()
+        target_context['context_type'] = context.context_type.value
         return await self.voice_applicator.apply_voice_patterns(
             voice_fingerprint,
-            target_context={
-                'strategy': 'preserve_original',
-                'fallback_reason': 'audience_adaptation_error',
-                'context_type': context.context_type.value
-            }
+            target_context=target_context
         )
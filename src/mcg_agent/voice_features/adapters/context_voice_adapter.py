@@ -1,8 +1,13 @@
 """Context voice adapter for context-specific voice adaptation logic."""
 
+import hashlib
 import logging
 import re
-from typing import Dict, List, Optional, Any, Tuple
+import time
+from bisect import bisect_right
+from collections import OrderedDict
+from dataclasses import replace
+from typing import ClassVar, Dict, FrozenSet, List, Optional, Any, Tuple, cast
 from datetime import datetime
 
 from ..protocols.voice_adaptation_protocol import (
@@ -15,6 +20,247 @@ from ...voice.voice_fingerprint_applicator import VoiceFingerprintApplicator
 
 logger = logging.getLogger(__name__)
 
+_WORD_FIND = re.compile(r'[a-z]+').findall
+
+# Indicator patterns that can only match text containing a literal marker.
+# Unions are also compiled without them, for texts where the marker is absent.
+_MARKER_PATTERNS = {
+    r'[!]{2,}': '!!',
+    r'#\w+': '#',
+    r'@\w+': '@'
+}
+
+# Audience indicators, checked in order, with the lowercase literals every match
+# contains; group 1 captures the audience
+_AUDIENCE_PATTERNS: Tuple[Tuple[re.Pattern, Tuple[str, ...]], ...] = (
+    (re.compile(r'dear\s+([^,\n]+)', re.IGNORECASE), ('dear',)),
+    (re.compile(r'to\s+([^,\n]+)', re.IGNORECASE), ('to',)),
+    (re.compile(r'@(\w+)', re.IGNORECASE), ('@',)),
+    (re.compile(r'for\s+([^,\n]+)\s+team', re.IGNORECASE), ('for', 'team')),
+    (re.compile(r'([^,\n]+)\s+department', re.IGNORECASE), ('department',))
+)
+
+def analysis_timestamp_iso(context: AdaptationContext) -> Optional[str]:
+    """ISO-8601 form of a context's ``analysis_timestamp_ns``, if present."""
+    timestamp_ns = (context.metadata or {}).get('analysis_timestamp_ns')
+    if timestamp_ns is None:
+        return None
+    return datetime.fromtimestamp(timestamp_ns / 1e9).isoformat()
+
+
+# Analysis cache key: (text digest, sorted metadata items)
+_CacheKey = Tuple[bytes, Tuple[Tuple[str, Any], ...]]
+
+# Context analysis patterns
+_FORMALITY_INDICATORS: Dict[str, List[str]] = {
+    'formal': [
+        r'\b(dear|sincerely|respectfully|regards)\b',
+        r'\b(please|kindly|would you)\b',
+        r'\b(furthermore|moreover|consequently)\b',
+        r'\b(pursuant to|in accordance with)\b'
+    ],
+    'casual': [
+        r'\b(hey|hi|hello|sup)\b',
+        r'\b(gonna|wanna|gotta)\b',
+        r'\b(awesome|cool|great|nice)\b',
+        r'\b(lol|haha|omg)\b'
+    ]
+}
+
+_URGENCY_INDICATORS: Dict[str, List[str]] = {
+    'high': [
+        r'\b(urgent|asap|immediately|emergency)\b',
+        r'\b(deadline|critical|important)\b',
+        r'[!]{2,}',  # Multiple exclamation marks; see _MARKER_PATTERNS
+        r'\b(need.{0,10}now|time.{0,10}sensitive)\b'
+    ],
+    'low': [
+        r'\b(whenever|eventually|no rush)\b',
+        r'\b(when you get a chance|at your convenience)\b'
+    ]
+}
+
+_PLATFORM_PATTERNS: Dict[str, Dict[str, Any]] = {
+    'email': {
+        'indicators': [r'subject:', r'dear', r'sincerely', r'best regards'],
+        'formality_boost': 0.3,
+        'professional_weight': 0.7
+    },
+    'social': {
+        'indicators': [r'#\w+', r'@\w+', r'RT:', r'share'],
+        'formality_boost': -0.2,
+        'casual_weight': 0.8
+    },
+    'messaging': {
+        'indicators': [r'\b(msg|text|chat)\b', r'[\U0001F300-\U0001FAFF]'],  # emoji range
+        'formality_boost': -0.3,
+        'conversational_weight': 0.9
+    }
+}
+
+# Keyword indicators per context type, checked as substrings
+_CONTEXT_TYPE_INDICATORS: Dict[ContextType, Tuple[str, ...]] = {
+    ContextType.PROFESSIONAL: (
+        'meeting', 'project', 'deadline', 'proposal', 'business',
+        'client', 'customer', 'revenue', 'strategy', 'analysis'
+    ),
+    ContextType.TECHNICAL: (
+        'api', 'database', 'algorithm', 'implementation', 'code',
+        'system', 'architecture', 'framework', 'deployment'
+    ),
+    ContextType.FORMAL: (
+        'dear sir', 'madam', 'to whom it may concern', 'respectfully',
+        'pursuant to', 'in accordance with', 'hereby'
+    ),
+    ContextType.CREATIVE: (
+        'story', 'creative', 'artistic', 'design', 'inspiration',
+        'imagination', 'innovative', 'brainstorm'
+    )
+}
+
+# Checked in order when no context type indicator matches
+_FALLBACK_CONTEXT_INDICATORS: Tuple[Tuple[ContextType, Tuple[str, ...]], ...] = (
+    (ContextType.PERSONAL, ('friend', 'family', 'personal', 'private')),
+    (ContextType.SOCIAL, ('social', 'share', 'post', 'tweet'))
+)
+
+_PURPOSE_PATTERNS: Dict[str, Tuple[str, ...]] = {
+    'request': ('please', 'could you', 'would you', 'can you', 'need'),
+    'information': ('inform', 'update', 'notify', 'let you know'),
+    'question': ('?', 'how', 'what', 'when', 'where', 'why', 'which'),
+    'response': ('thank you', 'thanks', 'in response to', 'regarding'),
+    'announcement': ('announce', 'pleased to', 'excited to', 'happy to')
+}
+
+# Checked in order; the first level with a matching term wins
+_RELATIONSHIP_INDICATORS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ('stranger', ('dear', 'sir', 'madam', 'mr.', 'ms.')),
+    ('acquaintance', ('hi', 'hello', 'colleague')),
+    ('friend', ('hey', 'buddy', 'pal', 'friend')),
+    ('family', ('love', 'honey', 'dear', 'family'))
+)
+
+# Checked in order; the first tone with a matching term wins
+_TONE_PATTERNS: Dict[str, Tuple[str, ...]] = {
+    'professional': ('professional', 'business', 'formal'),
+    'friendly': ('friendly', 'warm', 'welcoming'),
+    'casual': ('casual', 'relaxed', 'informal'),
+    'enthusiastic': ('excited', 'thrilled', 'amazing'),
+    'serious': ('serious', 'important', 'critical')
+}
+
+# Formality adjustments by context type and relationship level
+_CONTEXT_FORMALITY_ADJUSTMENTS: Dict[ContextType, float] = {
+    ContextType.PROFESSIONAL: 0.3,
+    ContextType.FORMAL: 0.4,
+    ContextType.TECHNICAL: 0.2,
+    ContextType.CASUAL: -0.3,
+    ContextType.SOCIAL: -0.2,
+    ContextType.PERSONAL: -0.1,
+    ContextType.CREATIVE: 0.0
+}
+
+_RELATIONSHIP_FORMALITY_ADJUSTMENTS: Dict[str, float] = {
+    'stranger': 0.2,
+    'acquaintance': 0.1,
+    'friend': -0.1,
+    'family': -0.2
+}
+
+
+def _split_indicators(indicators: Tuple[str, ...]) -> Tuple[FrozenSet[str], Tuple[str, ...]]:
+    """Split indicators into a word set and a tuple of multi-word phrases."""
+    words = frozenset(indicator for indicator in indicators if indicator.isalpha())
+    phrases = tuple(indicator for indicator in indicators if indicator not in words)
+    return words, phrases
+
+
+def _union_pattern(patterns: List[str], flags: int = 0) -> re.Pattern:
+    """Compile indicator patterns into a single alternation."""
+    return re.compile('|'.join(f'(?:{pattern})' for pattern in patterns), flags)
+
+
+def _without_markers(patterns: List[str]) -> List[str]:
+    """Indicator patterns minus the marker-guarded ones."""
+    return [pattern for pattern in patterns if pattern not in _MARKER_PATTERNS]
+
+
+def _markers(patterns: List[str]) -> Tuple[str, ...]:
+    """Literal markers guarding any of the given patterns."""
+    return tuple(_MARKER_PATTERNS[pattern] for pattern in patterns if pattern in _MARKER_PATTERNS)
+
+
+def _term_pattern(terms: Tuple[str, ...]) -> re.Pattern:
+    """Compile literal terms into a single substring alternation."""
+    return re.compile('|'.join(map(re.escape, terms)))
+
+
+def _formality_offsets(
+    context_type: ContextType,
+    platform: Optional[str],
+    relationship: Optional[str]
+) -> Tuple[float, float]:
+    """Formality base from context type and platform, and the relationship offset."""
+    base_formality = 0.5  # Start with neutral
+    base_formality += _CONTEXT_FORMALITY_ADJUSTMENTS.get(context_type, 0.0)
+    if platform:
+        base_formality += _PLATFORM_PATTERNS.get(platform, {}).get('formality_boost', 0.0)
+    relationship_offset = (
+        _RELATIONSHIP_FORMALITY_ADJUSTMENTS.get(relationship, 0.0) if relationship else 0.0
+    )
+    return base_formality, relationship_offset
+
+
+# Single-word indicators are matched as tokens; phrases as substrings
+_CONTEXT_TYPE_TERMS = {
+    context_type: _split_indicators(indicators)
+    for context_type, indicators in _CONTEXT_TYPE_INDICATORS.items()
+}
+_FALLBACK_CONTEXT_TERMS = tuple(
+    (context_type, *_split_indicators(indicators))
+    for context_type, indicators in _FALLBACK_CONTEXT_INDICATORS
+)
+
+# Compiled once at import, one alternation per indicator group. Urgency is
+# matched against lowercased text, so it is compiled without IGNORECASE.
+_URGENCY_RE = {
+    level: _union_pattern(patterns)
+    for level, patterns in _URGENCY_INDICATORS.items()
+}
+_URGENCY_PLAIN_RE = {
+    level: _union_pattern(_without_markers(patterns))
+    for level, patterns in _URGENCY_INDICATORS.items()
+}
+_URGENCY_MARKERS = _markers(
+    [pattern for patterns in _URGENCY_INDICATORS.values() for pattern in patterns]
+)
+_PLATFORM_RE = tuple(
+    (
+        platform,
+        _union_pattern(config['indicators'], re.IGNORECASE),
+        _union_pattern(_without_markers(config['indicators']), re.IGNORECASE)
+    )
+    for platform, config in _PLATFORM_PATTERNS.items()
+)
+_PLATFORM_MARKERS = _markers(
+    [pattern for config in _PLATFORM_PATTERNS.values() for pattern in config['indicators']]
+)
+
+# Audience classes, matched as substrings of the lowercased audience
+_EXECUTIVE_AUDIENCE_RE = _term_pattern(('executive', 'ceo', 'director'))
+_TECHNICAL_AUDIENCE_RE = _term_pattern(('developer', 'engineer', 'technical'))
+_PERSONAL_AUDIENCE_RE = _term_pattern(('friend', 'family'))
+_CASUAL_AUDIENCE_RE = _term_pattern(('friend', 'buddy', 'pal'))
+
+# Formality offsets for every (context type, platform, relationship);
+# only the audience adjustment is left to compute per call
+_FORMALITY_TABLE: Dict[Tuple[ContextType, Optional[str], Optional[str]], Tuple[float, float]] = {
+    (context_type, platform, relationship): _formality_offsets(context_type, platform, relationship)
+    for context_type in ContextType
+    for platform in (*_PLATFORM_PATTERNS, None)
+    for relationship in (*_RELATIONSHIP_FORMALITY_ADJUSTMENTS, None)
+}
+
 
 class ContextVoiceAdapter(ContextAnalysisProtocol):
     """
@@ -26,8 +272,30 @@ class ContextVoiceAdapter(ContextAnalysisProtocol):
     - Platform-specific voice adaptations
     - Purpose-driven voice modifications
     - Context-appropriate formality adjustments
+    
+    Indicator tables and compiled patterns are module-level and shared by
+    all instances; only the applicator and the analysis cache are per instance.
     """
     
+    # Context analysis patterns (shared, treat as read-only)
+    formality_indicators: ClassVar[Dict[str, List[str]]] = _FORMALITY_INDICATORS
+    urgency_indicators: ClassVar[Dict[str, List[str]]] = _URGENCY_INDICATORS
+    platform_patterns: ClassVar[Dict[str, Dict[str, Any]]] = _PLATFORM_PATTERNS
+    # Audience indicators; group 1 captures the audience
+    audience_patterns: ClassVar[List[str]] = [pattern.pattern for pattern, _ in _AUDIENCE_PATTERNS]
+    context_type_indicators: ClassVar[Dict[ContextType, Tuple[str, ...]]] = _CONTEXT_TYPE_INDICATORS
+    fallback_context_indicators: ClassVar[
+        Tuple[Tuple[ContextType, Tuple[str, ...]], ...]
+    ] = _FALLBACK_CONTEXT_INDICATORS
+    purpose_patterns: ClassVar[Dict[str, Tuple[str, ...]]] = _PURPOSE_PATTERNS
+    relationship_indicators: ClassVar[Tuple[Tuple[str, Tuple[str, ...]], ...]] = _RELATIONSHIP_INDICATORS
+    tone_patterns: ClassVar[Dict[str, Tuple[str, ...]]] = _TONE_PATTERNS
+    context_formality_adjustments: ClassVar[Dict[ContextType, float]] = _CONTEXT_FORMALITY_ADJUSTMENTS
+    relationship_formality_adjustments: ClassVar[Dict[str, float]] = _RELATIONSHIP_FORMALITY_ADJUSTMENTS
+    
+    # Maximum number of cached analyses per instance
+    context_cache_size = 1024
+    
     def __init__(self, voice_applicator: VoiceFingerprintApplicator):
         """
         Initialize context voice adapter.
@@ -37,52 +305,22 @@ class ContextVoiceAdapter(ContextAnalysisProtocol):
         """
         self.voice_applicator = voice_applicator
         
-        # Context analysis patterns
-        self.formality_indicators = {
-            'formal': [
-                r'\b(dear|sincerely|respectfully|regards)\b',
-                r'\b(please|kindly|would you)\b',
-                r'\b(furthermore|moreover|consequently)\b',
-                r'\b(pursuant to|in accordance with)\b'
-            ],
-            'casual': [
-                r'\b(hey|hi|hello|sup)\b',
-                r'\b(gonna|wanna|gotta)\b',
-                r'\b(awesome|cool|great|nice)\b',
-                r'\b(lol|haha|omg)\b'
-            ]
-        }
-        
-        self.urgency_indicators = {
-            'high': [
-                r'\b(urgent|asap|immediately|emergency)\b',
-                r'\b(deadline|critical|important)\b',
-                r'[!]{2,}',  # Multiple exclamation marks
-                r'\b(need.{0,10}now|time.{0,10}sensitive)\b'
-            ],
-            'low': [
-                r'\b(whenever|eventually|no rush)\b',
-                r'\b(when you get a chance|at your convenience)\b'
-            ]
-        }
-        
-        self.platform_patterns = {
-            'email': {
-                'indicators': [r'subject:', r'dear', r'sincerely', r'best regards'],
-                'formality_boost': 0.3,
-                'professional_weight': 0.7
-            },
-            'social': {
-                'indicators': [r'#\w+', r'@\w+', r'RT:', r'share'],
-                'formality_boost': -0.2,
-                'casual_weight': 0.8
-            },
-            'messaging': {
-                'indicators': [r'\b(msg|text|chat)\b', r'[😀-🙏]'],  # emoji range
-                'formality_boost': -0.3,
-                'conversational_weight': 0.9
-            }
-        }
+        # LRU cache of analyses keyed by text digest and metadata items
+        self._context_cache: "OrderedDict[_CacheKey, AdaptationContext]" = OrderedDict()
+    
+    @staticmethod
+    def _context_cache_key(
+        text: str,
+        metadata: Dict[str, Any]
+    ) -> Optional[_CacheKey]:
+        """Cache key for an analysis, or None if the metadata is not hashable."""
+        try:
+            metadata_key = tuple(sorted(metadata.items()))
+            hash(metadata_key)
+        except TypeError:
+            return None
+        digest = hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        return digest, metadata_key
     
     async def analyze_context(
         self,
@@ -104,64 +342,206 @@ class ContextVoiceAdapter(ContextAnalysisProtocol):
             if metadata is None:
                 metadata = {}
             
-            # Determine context type
-            context_type = await self._determine_context_type(text, metadata)
+            # Analysis is deterministic for a given text and metadata
+            cache_key = self._context_cache_key(text, metadata)
+            cached = self._get_cached_context(cache_key)
+            if cached is not None:
+                return cached
             
-            # Extract audience information
-            audience = await self._extract_audience(text, metadata)
+            # Lowercase once for the keyword helpers
+            text_lower = text.lower()
             
-            # Detect platform
-            platform = await self._detect_platform(text, metadata)
-            
-            # Analyze purpose
-            purpose = await self._analyze_purpose(text, metadata)
-            
-            # Determine formality level
-            formality_level = await self.determine_formality_level(
-                AdaptationContext(
-                    context_type=context_type,
-                    audience=audience,
-                    platform=platform,
-                    purpose=purpose
-                )
+            context = self._build_context(
+                text,
+                text_lower,
+                metadata,
+                platform=self._detect_platform(text, metadata),
+                urgency_level=self._analyze_urgency(text_lower)
             )
+            self._cache_context(cache_key, context)
+            return context
             
-            # Analyze urgency
-            urgency_level = await self._analyze_urgency(text)
-            
-            # Determine relationship level
-            relationship_level = await self._determine_relationship_level(text, metadata)
+        except Exception as e:
+            logger.error(f"Context analysis failed: {str(e)}")
+            return self._error_context(e)
+    
+    async def analyze_contexts_batch(
+        self,
+        texts: List[str],
+        metadata: Optional[List[Optional[Dict[str, Any]]]] = None
+    ) -> List[AdaptationContext]:
+        """
+        Analyze several texts, sharing one regex pass per indicator group.
+        
+        Results match calling analyze_context on each text. Urgency
+        indicators run once over the newline-joined batch, and matches are
+        assigned back to their text by offset. Platform detection stays per
+        text, where the search can stop at the first match.
+        
+        Args:
+            texts: Texts to analyze
+            metadata: Optional per-text metadata, parallel to texts
             
-            # Extract tone preference
-            tone_preference = await self._extract_tone_preference(text, metadata)
+        Returns:
+            One AdaptationContext per text, in order
+        """
+        if metadata is None:
+            metadata = [None] * len(texts)
+        elif len(metadata) != len(texts):
+            raise ValueError("metadata must have one entry per text")
+        
+        metadata_list = [item if item is not None else {} for item in metadata]
+        results: List[Optional[AdaptationContext]] = [None] * len(texts)
+        
+        # Serve cached analyses first; only misses join the batch scan
+        pending = []
+        for index, (text, text_metadata) in enumerate(zip(texts, metadata_list)):
+            cache_key = self._context_cache_key(text, text_metadata)
+            cached = self._get_cached_context(cache_key)
+            if cached is not None:
+                results[index] = cached
+            else:
+                pending.append((index, cache_key))
+        
+        if pending:
+            batch_texts = [texts[index] for index, _ in pending]
+            batch_lower = [text.lower() for text in batch_texts]
+            urgency_levels = self._batch_urgency(batch_lower)
             
-            context = AdaptationContext(
+            for (index, cache_key), text, text_lower, urgency_level in zip(
+                pending, batch_texts, batch_lower, urgency_levels
+            ):
+                text_metadata = metadata_list[index]
+                try:
+                    context = self._build_context(
+                        text,
+                        text_lower,
+                        text_metadata,
+                        platform=self._detect_platform(text, text_metadata),
+                        urgency_level=urgency_level
+                    )
+                    self._cache_context(cache_key, context)
+                except Exception as e:
+                    logger.error(f"Context analysis failed: {str(e)}")
+                    context = self._error_context(e)
+                results[index] = context
+        
+        # Every slot is filled by the cache pass or the batch pass
+        return cast(List[AdaptationContext], results)
+    
+    def _build_context(
+        self,
+        text: str,
+        text_lower: str,
+        metadata: Dict[str, Any],
+        platform: Optional[str],
+        urgency_level: float
+    ) -> AdaptationContext:
+        """Build the analyzed context given the platform and urgency."""
+        # Determine context type
+        context_type = self._determine_context_type(text_lower, metadata)
+        
+        # Extract audience information
+        audience = self._extract_audience(text, text_lower, metadata)
+        
+        # Analyze purpose
+        purpose = self._analyze_purpose(text_lower, metadata)
+        
+        # Determine formality level
+        formality_level = self._compute_formality_level(
+            AdaptationContext(
                 context_type=context_type,
                 audience=audience,
                 platform=platform,
-                purpose=purpose,
-                tone_preference=tone_preference,
-                formality_level=formality_level,
-                urgency_level=urgency_level,
-                relationship_level=relationship_level,
-                metadata={
-                    **metadata,
-                    'analysis_timestamp': datetime.now().isoformat(),
-                    'text_length': len(text),
-                    'analysis_confidence': 0.8  # TODO: Calculate actual confidence
-                }
-            )
-            
-            logger.debug(f"Context analysis completed: {context_type.value}, formality: {formality_level:.2f}")
-            return context
-            
-        except Exception as e:
-            logger.error(f"Context analysis failed: {str(e)}")
-            # Return default context
-            return AdaptationContext(
-                context_type=ContextType.CASUAL,
-                metadata={'analysis_error': str(e)}
+                purpose=purpose
             )
+        )
+        
+        # Determine relationship level
+        relationship_level = self._determine_relationship_level(text_lower, metadata)
+        
+        # Extract tone preference
+        tone_preference = self._extract_tone_preference(text_lower, metadata)
+        
+        context_metadata = dict(metadata)
+        context_metadata['analysis_timestamp_ns'] = time.time_ns()
+        context_metadata['text_length'] = len(text)
+        context_metadata['analysis_confidence'] = 0.8  # TODO: Calculate actual confidence
+        
+        context = AdaptationContext(
+            context_type=context_type,
+            audience=audience,
+            platform=platform,
+            purpose=purpose,
+            tone_preference=tone_preference,
+            formality_level=formality_level,
+            urgency_level=urgency_level,
+            relationship_level=relationship_level,
+            metadata=context_metadata
+        )
+        
+        logger.debug(f"Context analysis completed: {context_type.value}, formality: {formality_level:.2f}")
+        return context
+    
+    def _get_cached_context(self, cache_key: Optional[_CacheKey]) -> Optional[AdaptationContext]:
+        """Return a fresh copy of a cached analysis, or None on a miss."""
+        if cache_key is None:
+            return None
+        cached = self._context_cache.get(cache_key)
+        if cached is None:
+            return None
+        self._context_cache.move_to_end(cache_key)
+        context_metadata = dict(cached.metadata)
+        context_metadata['analysis_timestamp_ns'] = time.time_ns()
+        return replace(cached, metadata=context_metadata)
+    
+    def _cache_context(self, cache_key: Optional[_CacheKey], context: AdaptationContext) -> None:
+        """Cache a private copy so callers can't mutate the cached metadata."""
+        if cache_key is None:
+            return
+        self._context_cache[cache_key] = replace(context, metadata=dict(context.metadata))
+        if len(self._context_cache) > self.context_cache_size:
+            self._context_cache.popitem(last=False)
+    
+    @staticmethod
+    def _error_context(error: Exception) -> AdaptationContext:
+        """Default context returned when analysis fails."""
+        return AdaptationContext(
+            context_type=ContextType.CASUAL,
+            metadata={'analysis_error': str(error)}
+        )
+    
+    @staticmethod
+    def _batch_match(pattern: re.Pattern, blob: str, offsets: List[int]) -> List[int]:
+        """Count pattern matches per text in a joined blob.
+        
+        ``offsets`` holds the start of each text in ``blob``. The indicator
+        patterns never match across the newline separator.
+        """
+        counts = [0] * len(offsets)
+        for match in pattern.finditer(blob):
+            counts[bisect_right(offsets, match.start()) - 1] += 1
+        return counts
+    
+    @staticmethod
+    def _join_batch(texts: List[str]) -> Tuple[str, List[int]]:
+        """Join texts with newlines and return the blob and text offsets."""
+        offsets = []
+        position = 0
+        for text in texts:
+            offsets.append(position)
+            position += len(text) + 1
+        return '\n'.join(texts), offsets
+    
+    def _batch_urgency(self, texts_lower: List[str]) -> List[float]:
+        """Urgency levels for lowercased texts, one scan per urgency group."""
+        blob, offsets = self._join_batch(texts_lower)
+        urgency_re = self._urgency_patterns_for(blob)
+        high_counts = self._batch_match(urgency_re['high'], blob, offsets)
+        low_counts = self._batch_match(urgency_re['low'], blob, offsets)
+        return [
+            self._urgency_score(high, low) for high, low in zip(high_counts, low_counts)
+        ]
     
     async def extract_audience_info(
         self,
@@ -191,13 +571,13 @@ class ContextVoiceAdapter(ContextAnalysisProtocol):
         
         # Analyze audience characteristics
         if context.audience:
-            audience_info['audience_characteristics'] = await self._analyze_audience_characteristics(
+            audience_info['audience_characteristics'] = self._analyze_audience_characteristics(
                 context.audience
             )
         
         # Platform-specific audience adjustments
         if context.platform:
-            audience_info['platform_adjustments'] = await self._get_platform_audience_adjustments(
+            audience_info['platform_adjustments'] = self._get_platform_audience_adjustments(
                 context.platform
             )
         
@@ -216,59 +596,72 @@ class ContextVoiceAdapter(ContextAnalysisProtocol):
         Returns:
             Formality level (0.0 = casual, 1.0 = formal)
         """
-        base_formality = 0.5  # Start with neutral
-        
-        # Context type adjustments
-        context_adjustments = {
-            ContextType.PROFESSIONAL: 0.3,
-            ContextType.FORMAL: 0.4,
-            ContextType.TECHNICAL: 0.2,
-            ContextType.CASUAL: -0.3,
-            ContextType.SOCIAL: -0.2,
-            ContextType.PERSONAL: -0.1,
-            ContextType.CREATIVE: 0.0
-        }
-        
-        base_formality += context_adjustments.get(context.context_type, 0.0)
+        return self._compute_formality_level(context)
+    
+    def _compute_formality_level(self, context: AdaptationContext) -> float:
+        """Compute the formality level for a context."""
+        platform = context.platform.lower() if context.platform else None
+        relationship = context.relationship_level
+        key = (
+            context.context_type,
+            platform if platform in self.platform_patterns else None,
+            relationship if relationship in self.relationship_formality_adjustments else None
+        )
         
-        # Platform adjustments
-        if context.platform:
-            platform_adjustment = self.platform_patterns.get(
-                context.platform.lower(), {}
-            ).get('formality_boost', 0.0)
-            base_formality += platform_adjustment
+        # Context type and platform base, plus relationship offset
+        offsets = _FORMALITY_TABLE.get(key)
+        if offsets is None:
+            offsets = _formality_offsets(*key)
+        base_formality, relationship_offset = offsets
         
         # Audience adjustments
         if context.audience:
-            if any(term in context.audience.lower() for term in ['executive', 'ceo', 'director']):
+            audience_lower = context.audience.lower()
+            if _EXECUTIVE_AUDIENCE_RE.search(audience_lower):
                 base_formality += 0.2
-            elif any(term in context.audience.lower() for term in ['friend', 'buddy', 'pal']):
+            elif _CASUAL_AUDIENCE_RE.search(audience_lower):
                 base_formality -= 0.2
         
         # Relationship level adjustments
-        relationship_adjustments = {
-            'stranger': 0.2,
-            'acquaintance': 0.1,
-            'friend': -0.1,
-            'family': -0.2
-        }
-        
-        if context.relationship_level:
-            base_formality += relationship_adjustments.get(context.relationship_level, 0.0)
+        base_formality += relationship_offset
         
         # Ensure formality level is within bounds
         return max(0.0, min(1.0, base_formality))
     
-    async def enhance_context_analysis(self, context: AdaptationContext) -> AdaptationContext:
-        """Enhance existing context with additional analysis."""
-        enhanced_metadata = context.metadata.copy() if context.metadata else {}
+    async def enhance_context_analysis(
+        self,
+        context: AdaptationContext,
+        *,
+        inplace: bool = False
+    ) -> AdaptationContext:
+        """
+        Enhance existing context with additional analysis.
         
+        Args:
+            context: Context to enhance
+            inplace: Update context.metadata and return the same object instead
+                of a copy. Only safe when the caller does not keep the original
+                context; the default returns a new context.
+            
+        Returns:
+            Enhanced context
+        """
         # Add enhanced analysis
-        enhanced_metadata.update({
-            'context_confidence': await self._calculate_context_confidence(context),
-            'adaptation_recommendations': await self._get_adaptation_recommendations(context),
-            'voice_adjustments': await self._get_voice_adjustments(context)
-        })
+        enhancements = {
+            'context_confidence': self._calculate_context_confidence(context),
+            'adaptation_recommendations': self._get_adaptation_recommendations(context),
+            'voice_adjustments': self._get_voice_adjustments(context)
+        }
+        
+        if inplace:
+            if context.metadata:
+                context.metadata.update(enhancements)
+            else:
+                context.metadata = enhancements
+            return context
+        
+        enhanced_metadata = context.metadata.copy() if context.metadata else {}
+        enhanced_metadata.update(enhancements)
         
         # Create enhanced context
         return AdaptationContext(
@@ -290,7 +683,7 @@ class ContextVoiceAdapter(ContextAnalysisProtocol):
     ) -> Dict[str, Any]:
         """Get context-specific voice patterns."""
         # Apply context-specific voice patterns
-        return await self.voice_applicator.apply_voice_patterns(
+        return await self.voice_applicator.apply_voice_patterns(  # type: ignore[attr-defined, no-any-return]
             voice_fingerprint,
             target_context={
                 'strategy': 'context_specific',
@@ -305,14 +698,12 @@ class ContextVoiceAdapter(ContextAnalysisProtocol):
     
     # Private helper methods
     
-    async def _determine_context_type(
+    def _determine_context_type(
         self,
-        text: str,
+        text_lower: str,
         metadata: Dict[str, Any]
     ) -> ContextType:
-        """Determine the primary context type."""
-        text_lower = text.lower()
-        
+        """Determine the primary context type from lowercased text."""
         # Check metadata first
         if 'context_type' in metadata:
             try:
@@ -320,191 +711,134 @@ class ContextVoiceAdapter(ContextAnalysisProtocol):
             except ValueError:
                 pass
         
-        # Professional indicators
-        professional_indicators = [
-            'meeting', 'project', 'deadline', 'proposal', 'business',
-            'client', 'customer', 'revenue', 'strategy', 'analysis'
-        ]
+        # Tokenize once; a trailing "s" is also dropped so plurals still match
+        tokens = set(_WORD_FIND(text_lower))
+        tokens.update([token[:-1] for token in tokens if token.endswith('s')])
         
-        # Technical indicators
-        technical_indicators = [
-            'api', 'database', 'algorithm', 'implementation', 'code',
-            'system', 'architecture', 'framework', 'deployment'
-        ]
-        
-        # Formal indicators
-        formal_indicators = [
-            'dear sir', 'madam', 'to whom it may concern', 'respectfully',
-            'pursuant to', 'in accordance with', 'hereby'
-        ]
-        
-        # Creative indicators
-        creative_indicators = [
-            'story', 'creative', 'artistic', 'design', 'inspiration',
-            'imagination', 'innovative', 'brainstorm'
-        ]
-        
-        # Count indicators
-        professional_count = sum(1 for indicator in professional_indicators if indicator in text_lower)
-        technical_count = sum(1 for indicator in technical_indicators if indicator in text_lower)
-        formal_count = sum(1 for indicator in formal_indicators if indicator in text_lower)
-        creative_count = sum(1 for indicator in creative_indicators if indicator in text_lower)
-        
-        # Determine context based on highest count
-        counts = {
-            ContextType.PROFESSIONAL: professional_count,
-            ContextType.TECHNICAL: technical_count,
-            ContextType.FORMAL: formal_count,
-            ContextType.CREATIVE: creative_count
-        }
-        
-        max_context = max(counts, key=counts.get)
+        # Count indicators per context type; the first type with the top count wins
+        max_context, max_count = None, 0
+        for context_type, (words, phrases) in _CONTEXT_TYPE_TERMS.items():
+            count = len(tokens & words) + sum(1 for phrase in phrases if phrase in text_lower)
+            if count > max_count:
+                max_context, max_count = context_type, count
         
         # If no clear winner, check for social/personal indicators
-        if counts[max_context] == 0:
-            if any(pattern in text_lower for pattern in ['friend', 'family', 'personal', 'private']):
-                return ContextType.PERSONAL
-            elif any(pattern in text_lower for pattern in ['social', 'share', 'post', 'tweet']):
-                return ContextType.SOCIAL
-            else:
-                return ContextType.CASUAL
+        if max_context is None:
+            for context_type, words, phrases in _FALLBACK_CONTEXT_TERMS:
+                if not tokens.isdisjoint(words) or any(phrase in text_lower for phrase in phrases):
+                    return context_type
+            return ContextType.CASUAL
         
         return max_context
     
-    async def _extract_audience(self, text: str, metadata: Dict[str, Any]) -> Optional[str]:
+    def _extract_audience(
+        self,
+        text: str,
+        text_lower: str,
+        metadata: Dict[str, Any]
+    ) -> Optional[str]:
         """Extract audience information from text and metadata."""
         # Check metadata first
         if 'audience' in metadata:
-            return metadata['audience']
-        
-        # Look for audience indicators in text
-        audience_patterns = [
-            r'dear\s+([^,\n]+)',
-            r'to\s+([^,\n]+)',
-            r'@(\w+)',
-            r'for\s+([^,\n]+)\s+team',
-            r'([^,\n]+)\s+department'
-        ]
-        
-        for pattern in audience_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+            return cast(Optional[str], metadata['audience'])
+        
+        # Look for audience indicators in text, skipping patterns whose
+        # literals are absent
+        for pattern, literals in _AUDIENCE_PATTERNS:
+            if not all(literal in text_lower for literal in literals):
+                continue
+            match = pattern.search(text)
             if match:
                 return match.group(1).strip()
         
         return None
     
-    async def _detect_platform(self, text: str, metadata: Dict[str, Any]) -> Optional[str]:
+    def _detect_platform(self, text: str, metadata: Dict[str, Any]) -> Optional[str]:
         """Detect the communication platform."""
         # Check metadata first
         if 'platform' in metadata:
-            return metadata['platform']
+            return cast(Optional[str], metadata['platform'])
         
-        # Platform detection patterns
-        for platform, config in self.platform_patterns.items():
-            for indicator in config['indicators']:
-                if re.search(indicator, text, re.IGNORECASE):
-                    return platform
+        # Platform detection patterns; marker patterns only run if a marker is present
+        has_marker = any(marker in text for marker in _PLATFORM_MARKERS)
+        for platform, indicators, plain_indicators in _PLATFORM_RE:
+            if (indicators if has_marker else plain_indicators).search(text):
+                return platform
         
         return None
     
-    async def _analyze_purpose(self, text: str, metadata: Dict[str, Any]) -> Optional[str]:
-        """Analyze the purpose of the communication."""
+    def _analyze_purpose(self, text_lower: str, metadata: Dict[str, Any]) -> Optional[str]:
+        """Analyze the purpose of the communication from lowercased text."""
         # Check metadata first
         if 'purpose' in metadata:
-            return metadata['purpose']
-        
-        text_lower = text.lower()
-        
-        # Purpose indicators
-        purpose_patterns = {
-            'request': ['please', 'could you', 'would you', 'can you', 'need'],
-            'information': ['inform', 'update', 'notify', 'let you know'],
-            'question': ['?', 'how', 'what', 'when', 'where', 'why', 'which'],
-            'response': ['thank you', 'thanks', 'in response to', 'regarding'],
-            'announcement': ['announce', 'pleased to', 'excited to', 'happy to']
-        }
+            return cast(Optional[str], metadata['purpose'])
         
-        purpose_scores = {}
-        for purpose, indicators in purpose_patterns.items():
+        # The first purpose with the top score wins
+        best_purpose, best_score = None, 0
+        for purpose, indicators in self.purpose_patterns.items():
             score = sum(1 for indicator in indicators if indicator in text_lower)
-            if score > 0:
-                purpose_scores[purpose] = score
-        
-        if purpose_scores:
-            return max(purpose_scores, key=purpose_scores.get)
+            if score > best_score:
+                best_purpose, best_score = purpose, score
         
-        return None
+        return best_purpose
     
-    async def _analyze_urgency(self, text: str) -> float:
-        """Analyze urgency level from text."""
-        urgency_score = 0.0
-        text_lower = text.lower()
-        
-        # High urgency indicators
-        for pattern in self.urgency_indicators['high']:
-            if re.search(pattern, text_lower):
-                urgency_score += 0.3
-        
-        # Low urgency indicators
-        for pattern in self.urgency_indicators['low']:
-            if re.search(pattern, text_lower):
-                urgency_score -= 0.2
+    def _analyze_urgency(self, text_lower: str) -> float:
+        """Analyze urgency level from lowercased text."""
+        # Urgency indicators, counted per occurrence
+        urgency_re = self._urgency_patterns_for(text_lower)
+        return self._urgency_score(
+            len(urgency_re['high'].findall(text_lower)),
+            len(urgency_re['low'].findall(text_lower))
+        )
+    
+    def _urgency_patterns_for(self, text_lower: str) -> Dict[str, re.Pattern]:
+        """Urgency unions to scan with; marker patterns only if a marker is present."""
+        if any(marker in text_lower for marker in _URGENCY_MARKERS):
+            return _URGENCY_RE
+        return _URGENCY_PLAIN_RE
+    
+    @staticmethod
+    def _urgency_score(high_count: int, low_count: int) -> float:
+        """Urgency level from high and low urgency indicator counts."""
+        urgency_score = 0.3 * high_count - 0.2 * low_count
         
         # Normalize to 0.0-1.0 range
         return max(0.0, min(1.0, urgency_score + 0.5))
     
-    async def _determine_relationship_level(
+    def _determine_relationship_level(
         self,
-        text: str,
+        text_lower: str,
         metadata: Dict[str, Any]
     ) -> Optional[str]:
-        """Determine relationship level with audience."""
+        """Determine relationship level with audience from lowercased text."""
         # Check metadata first
         if 'relationship' in metadata:
-            return metadata['relationship']
-        
-        text_lower = text.lower()
+            return cast(Optional[str], metadata['relationship'])
         
         # Relationship indicators
-        if any(term in text_lower for term in ['dear', 'sir', 'madam', 'mr.', 'ms.']):
-            return 'stranger'
-        elif any(term in text_lower for term in ['hi', 'hello', 'colleague']):
-            return 'acquaintance'
-        elif any(term in text_lower for term in ['hey', 'buddy', 'pal', 'friend']):
-            return 'friend'
-        elif any(term in text_lower for term in ['love', 'honey', 'dear', 'family']):
-            return 'family'
+        for relationship, terms in self.relationship_indicators:
+            if any(term in text_lower for term in terms):
+                return relationship
         
         return None
     
-    async def _extract_tone_preference(
+    def _extract_tone_preference(
         self,
-        text: str,
+        text_lower: str,
         metadata: Dict[str, Any]
     ) -> Optional[str]:
-        """Extract tone preference from context."""
+        """Extract tone preference from lowercased text and metadata."""
         # Check metadata first
         if 'tone' in metadata:
-            return metadata['tone']
-        
-        text_lower = text.lower()
-        
-        # Tone indicators
-        tone_patterns = {
-            'professional': ['professional', 'business', 'formal'],
-            'friendly': ['friendly', 'warm', 'welcoming'],
-            'casual': ['casual', 'relaxed', 'informal'],
-            'enthusiastic': ['excited', 'thrilled', 'amazing'],
-            'serious': ['serious', 'important', 'critical']
-        }
+            return cast(Optional[str], metadata['tone'])
         
-        for tone, indicators in tone_patterns.items():
+        for tone, indicators in self.tone_patterns.items():
             if any(indicator in text_lower for indicator in indicators):
                 return tone
         
         return None
     
-    async def _analyze_audience_characteristics(self, audience: str) -> Dict[str, Any]:
+    def _analyze_audience_characteristics(self, audience: str) -> Dict[str, Any]:
         """Analyze characteristics of the target audience."""
         audience_lower = audience.lower()
         
@@ -515,19 +849,19 @@ class ContextVoiceAdapter(ContextAnalysisProtocol):
         }
         
         # Adjust based on audience type
-        if any(term in audience_lower for term in ['executive', 'ceo', 'director']):
+        if _EXECUTIVE_AUDIENCE_RE.search(audience_lower):
             characteristics['formality_preference'] = 0.8
             characteristics['technical_level'] = 0.6
-        elif any(term in audience_lower for term in ['developer', 'engineer', 'technical']):
+        elif _TECHNICAL_AUDIENCE_RE.search(audience_lower):
             characteristics['formality_preference'] = 0.4
             characteristics['technical_level'] = 0.9
-        elif any(term in audience_lower for term in ['friend', 'family']):
+        elif _PERSONAL_AUDIENCE_RE.search(audience_lower):
             characteristics['formality_preference'] = 0.2
             characteristics['relationship_type'] = 'personal'
         
         return characteristics
     
-    async def _get_platform_audience_adjustments(self, platform: str) -> Dict[str, Any]:
+    def _get_platform_audience_adjustments(self, platform: str) -> Dict[str, Any]:
         """Get platform-specific audience adjustments."""
         platform_config = self.platform_patterns.get(platform.lower(), {})
         
@@ -540,7 +874,7 @@ class ContextVoiceAdapter(ContextAnalysisProtocol):
             }
         }
     
-    async def _calculate_context_confidence(self, context: AdaptationContext) -> float:
+    def _calculate_context_confidence(self, context: AdaptationContext) -> float:
         """Calculate confidence in context analysis."""
         confidence_factors = []
         
@@ -570,7 +904,7 @@ class ContextVoiceAdapter(ContextAnalysisProtocol):
         
         return sum(confidence_factors) / len(confidence_factors)
     
-    async def _get_adaptation_recommendations(self, context: AdaptationContext) -> List[str]:
+    def _get_adaptation_recommendations(self, context: AdaptationContext) -> List[str]:
         """Get adaptation recommendations for context."""
         recommendations = []
         
@@ -589,7 +923,7 @@ class ContextVoiceAdapter(ContextAnalysisProtocol):
         
         return recommendations
     
-    async def _get_voice_adjustments(self, context: AdaptationContext) -> Dict[str, Any]:
+    def _get_voice_adjustments(self, context: AdaptationContext) -> Dict[str, Any]:
         """Get specific voice adjustments for context."""
         adjustments = {
             'formality_adjustment': context.formality_level or 0.5,
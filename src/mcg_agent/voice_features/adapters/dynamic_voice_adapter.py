@@ -2,8 +2,12 @@
 
 import asyncio
 import logging
-from typing import Dict, List, Optional, Any
-from datetime import datetime
+import threading
+import time
+from collections import OrderedDict, deque
+from functools import lru_cache
+from operator import itemgetter
+from typing import Awaitable, Callable, ClassVar, Deque, Dict, FrozenSet, List, Optional, Any, Set, Tuple
 
 from ..protocols.voice_adaptation_protocol import (
     VoiceAdaptationProtocol,
@@ -19,6 +23,63 @@ from ...security.personal_voice_audit_trail import PersonalVoiceAuditTrail
 
 logger = logging.getLogger(__name__)
 
+# Adaptation cache key: (user_id, fingerprint hash, context type, audience, platform, strategy)
+_AdaptationCacheKey = Tuple[str, str, str, Optional[str], Optional[str], str]
+
+# Platforms whose audiences call for audience adaptation
+_AUDIENCE_ADAPT_PLATFORMS: FrozenSet[str] = frozenset({'linkedin', 'email'})
+
+# Weights of each validation score in the overall confidence
+_VALIDATION_WEIGHTS: Tuple[Tuple[str, float], ...] = (
+    ('authenticity', 0.4),
+    ('appropriateness', 0.3),
+    ('tone_consistency', 0.3)
+)
+
+
+@lru_cache(maxsize=256)
+def _recommend_strategies(
+    context_type: ContextType,
+    professional_audience: bool,
+    audience_platform: bool
+) -> Tuple[AdaptationStrategy, ...]:
+    """Recommended strategies for a context type and audience/platform buckets."""
+    strategies = []
+    
+    # Analyze context to recommend strategies
+    if context_type == ContextType.PROFESSIONAL:
+        strategies.extend([
+            AdaptationStrategy.ADAPT_TO_AUDIENCE,
+            AdaptationStrategy.CONTEXT_SPECIFIC
+        ])
+    elif context_type == ContextType.CASUAL:
+        strategies.extend([
+            AdaptationStrategy.PRESERVE_ORIGINAL,
+            AdaptationStrategy.BLEND_CONTEXTS
+        ])
+    elif context_type == ContextType.FORMAL:
+        strategies.extend([
+            AdaptationStrategy.CONTEXT_SPECIFIC,
+            AdaptationStrategy.ADAPT_TO_AUDIENCE
+        ])
+    else:
+        # Default strategies
+        strategies.extend([
+            AdaptationStrategy.ADAPT_TO_AUDIENCE,
+            AdaptationStrategy.BLEND_CONTEXTS
+        ])
+    
+    # Consider audience and platform
+    if professional_audience:
+        if AdaptationStrategy.CONTEXT_SPECIFIC not in strategies:
+            strategies.append(AdaptationStrategy.CONTEXT_SPECIFIC)
+    
+    if audience_platform:
+        if AdaptationStrategy.ADAPT_TO_AUDIENCE not in strategies:
+            strategies.append(AdaptationStrategy.ADAPT_TO_AUDIENCE)
+    
+    return tuple(strategies[:3])  # Return top 3 recommendations
+
 
 class DynamicVoiceAdapter(VoiceAdaptationProtocol):
     """
@@ -29,15 +90,28 @@ class DynamicVoiceAdapter(VoiceAdaptationProtocol):
     - Selecting appropriate adaptation strategies
     - Applying voice modifications while preserving authenticity
     - Validating adaptation results for quality assurance
+    
+    Adapters created with ``share_cache=True`` use one process-wide adaptation
+    cache, so request-scoped instances still hit results cached by earlier
+    requests. Only share it between adapters with equivalent collaborators.
     """
     
+    # Process-wide adaptation cache for adapters created with share_cache=True
+    shared_cache_size: ClassVar[int] = 1024
+    _shared_adaptation_cache: ClassVar[
+        "OrderedDict[_AdaptationCacheKey, Tuple[AdaptationResult, float]]"
+    ] = OrderedDict()
+    _shared_cache_order: ClassVar[Deque[Tuple[_AdaptationCacheKey, float]]] = deque()
+    _shared_cache_lock: ClassVar[threading.Lock] = threading.Lock()
+    
     def __init__(
         self,
         voice_applicator: VoiceFingerprintApplicator,
         governance_manager: PersonalDataGovernanceManager,
         audit_trail: PersonalVoiceAuditTrail,
         context_analyzer: Optional['ContextVoiceAdapter'] = None,
-        audience_adapter: Optional['AudienceVoiceAdapter'] = None
+        audience_adapter: Optional['AudienceVoiceAdapter'] = None,
+        share_cache: bool = False
     ):
         """
         Initialize dynamic voice adapter.
@@ -48,6 +122,7 @@ class DynamicVoiceAdapter(VoiceAdaptationProtocol):
             audit_trail: Voice audit trail system
             context_analyzer: Optional context analyzer
             audience_adapter: Optional audience adapter
+            share_cache: Use the process-wide adaptation cache instead of a per-instance one
         """
         self.voice_applicator = voice_applicator
         self.governance_manager = governance_manager
@@ -55,17 +130,41 @@ class DynamicVoiceAdapter(VoiceAdaptationProtocol):
         self.context_analyzer = context_analyzer
         self.audience_adapter = audience_adapter
         
-        # Adaptation configuration
-        self.adaptation_cache: Dict[str, AdaptationResult] = {}
+        # Strategy handlers; unknown strategies fall back to audience adaptation
+        self._strategy_dispatch: Dict[
+            AdaptationStrategy,
+            Callable[[VoiceFingerprint, AdaptationContext], Awaitable[Dict[str, Any]]]
+        ] = {
+            AdaptationStrategy.PRESERVE_ORIGINAL: self._preserve_original_voice,
+            AdaptationStrategy.ADAPT_TO_AUDIENCE: self._adapt_to_audience,
+            AdaptationStrategy.BLEND_CONTEXTS: self._blend_contexts,
+            AdaptationStrategy.CONTEXT_SPECIFIC: self._apply_context_specific
+        }
+        
+        # Adaptation configuration; LRU cache entries are (result, monotonic cache time)
         self.cache_ttl_seconds = 300  # 5 minutes
-        self.max_cache_size = 100
+        self.adaptation_cache: "OrderedDict[_AdaptationCacheKey, Tuple[AdaptationResult, float]]"
+        # (key, cache time) records in insertion order, so expiry pops from the left
+        self._cache_order: Deque[Tuple[_AdaptationCacheKey, float]]
+        if share_cache:
+            self.adaptation_cache = self._shared_adaptation_cache
+            self._cache_order = self._shared_cache_order
+            self._cache_lock = self._shared_cache_lock
+            self.max_cache_size = self.shared_cache_size
+        else:
+            self.adaptation_cache = OrderedDict()
+            self._cache_order = deque()
+            self._cache_lock = threading.Lock()
+            self.max_cache_size = 100
         
-        # Performance tracking
-        self.adaptation_metrics: Dict[str, List[float]] = {
-            'adaptation_time': [],
-            'confidence_scores': [],
-            'validation_scores': []
+        # Performance tracking; each deque keeps the most recent 100 values
+        self.adaptation_metrics: Dict[str, Deque[float]] = {
+            metric_name: deque(maxlen=100)
+            for metric_name in ('adaptation_time', 'confidence_scores', 'validation_scores')
         }
+        
+        # Audit writes run in the background; references keep them from being collected
+        self._pending_audits: Set['asyncio.Task[None]'] = set()
     
     async def adapt_voice(
         self,
@@ -84,81 +183,110 @@ class DynamicVoiceAdapter(VoiceAdaptationProtocol):
         Returns:
             AdaptationResult with adapted voice context
         """
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         try:
-            # Check governance permissions
-            await self._validate_adaptation_permissions(voice_fingerprint, context)
+            strategy_value = strategy.value
             
-            # Check cache for recent adaptation
-            cache_key = self._generate_cache_key(voice_fingerprint, context, strategy)
+            # Check cache for recent adaptation; governance is still checked before serving it
+            cache_key = self._generate_cache_key(voice_fingerprint, context, strategy_value)
             cached_result = self._get_cached_adaptation(cache_key)
             if cached_result:
-                logger.debug(f"Using cached adaptation for context: {context.context_type}")
+                await self._validate_adaptation_permissions(voice_fingerprint, context)
+                logger.debug("Using cached adaptation for context: %s", context.context_type)
                 return cached_result
             
-            # Analyze context if analyzer available
+            # Analyze context if analyzer available, overlapping the governance check
             if self.context_analyzer:
-                context = await self.context_analyzer.enhance_context_analysis(context)
-            
-            # Apply adaptation strategy
-            adapted_context = await self._apply_adaptation_strategy(
-                voice_fingerprint, context, strategy
-            )
-            
-            # Validate adaptation
-            validation_scores = await self.validate_adaptation(
-                voice_fingerprint, adapted_context, context
-            )
+                enhance_task = asyncio.create_task(
+                    self.context_analyzer.enhance_context_analysis(context)
+                )
+                try:
+                    await self._validate_adaptation_permissions(voice_fingerprint, context)
+                except BaseException:
+                    enhance_task.cancel()
+                    raise
+                context = await enhance_task
+            else:
+                await self._validate_adaptation_permissions(voice_fingerprint, context)
             
-            # Create adaptation result
-            adaptation_result = AdaptationResult(
-                adapted_voice_context=adapted_context,
-                adaptation_strategy=strategy,
-                confidence_score=validation_scores.get('overall_confidence', 0.8),
-                adaptation_notes=await self._generate_adaptation_notes(
-                    voice_fingerprint, context, strategy
-                ),
-                original_patterns_preserved=await self._identify_preserved_patterns(
-                    voice_fingerprint, adapted_context
-                ),
-                patterns_modified=await self._identify_modified_patterns(
-                    voice_fingerprint, adapted_context
-                ),
-                context_analysis=await self._analyze_context_details(context),
-                performance_metrics={
-                    'adaptation_time_ms': (datetime.now() - start_time).total_seconds() * 1000,
-                    'validation_score': validation_scores.get('authenticity', 0.0),
-                    'appropriateness_score': validation_scores.get('appropriateness', 0.0)
-                }
+            adaptation_result = await self._create_adaptation(
+                voice_fingerprint, context, strategy, strategy_value, cache_key, start_time
             )
             
-            # Cache result
-            self._cache_adaptation(cache_key, adaptation_result)
-            
-            # Record audit trail
-            await self.audit_trail.log_voice_pattern_access(
-                user_id="current_user",  # TODO: Get from context
-                access_type="voice_adaptation",
+            # Record audit trail off the return path; close() flushes pending writes
+            self._record_audit(
                 patterns_accessed=adaptation_result.original_patterns_preserved,
                 context={
-                    'adaptation_strategy': strategy.value,
-                    'context_type': context.context_type.value,
+                    'adaptation_strategy': strategy_value,
+                    'context_type': adaptation_result.context_analysis['context_type'],
                     'confidence_score': adaptation_result.confidence_score
                 }
             )
             
-            # Update performance metrics
-            self._update_performance_metrics(adaptation_result)
-            
-            logger.info(f"Voice adaptation completed with confidence: {adaptation_result.confidence_score:.2f}")
+            logger.info("Voice adaptation completed with confidence: %.2f", adaptation_result.confidence_score)
             return adaptation_result
             
         except Exception as e:
-            logger.error(f"Voice adaptation failed: {str(e)}")
+            logger.error("Voice adaptation failed: %s", e)
             # Return fallback adaptation
             return await self._create_fallback_adaptation(voice_fingerprint, context, strategy)
     
+    async def adapt_voice_batch(
+        self,
+        voice_fingerprint: VoiceFingerprint,
+        contexts: List[AdaptationContext],
+        strategy: AdaptationStrategy = AdaptationStrategy.ADAPT_TO_AUDIENCE
+    ) -> List[AdaptationResult]:
+        """
+        Adapt one voice fingerprint to several contexts concurrently.
+        
+        Governance is checked once for the whole batch and the fresh
+        adaptations are recorded as a single audit event.
+        
+        Args:
+            voice_fingerprint: User's voice fingerprint
+            contexts: Adaptation contexts, e.g. one per channel
+            strategy: Adaptation strategy to use
+            
+        Returns:
+            AdaptationResults in the same order as contexts
+        """
+        if not contexts:
+            return []
+        
+        try:
+            # Permission is per user and usage type, so one check covers every context
+            await self._validate_adaptation_permissions(voice_fingerprint, contexts[0])
+        except Exception as e:
+            logger.error("Voice adaptation failed: %s", e)
+            return [
+                await self._create_fallback_adaptation(voice_fingerprint, context, strategy)
+                for context in contexts
+            ]
+        
+        strategy_value = strategy.value
+        outcomes = await asyncio.gather(*(
+            self._adapt_permitted(voice_fingerprint, context, strategy, strategy_value)
+            for context in contexts
+        ))
+        
+        fresh = [result for result, is_fresh in outcomes if is_fresh]
+        if fresh:
+            self._record_audit(
+                patterns_accessed=list(dict.fromkeys(
+                    pattern for result in fresh for pattern in result.original_patterns_preserved
+                )),
+                context={
+                    'adaptation_strategy': strategy_value,
+                    'context_types': [result.context_analysis['context_type'] for result in fresh],
+                    'confidence_scores': [result.confidence_score for result in fresh]
+                }
+            )
+        
+        logger.info("Batch voice adaptation completed for %d contexts", len(contexts))
+        return [result for result, _ in outcomes]
+    
     async def validate_adaptation(
         self,
         original_fingerprint: VoiceFingerprint,
@@ -180,36 +308,34 @@ class DynamicVoiceAdapter(VoiceAdaptationProtocol):
         
         try:
             # Authenticity validation
-            authenticity_score = await self._validate_authenticity(
+            authenticity_score = self._validate_authenticity(
                 original_fingerprint, adapted_context
             )
             validation_scores['authenticity'] = authenticity_score
             
             # Context appropriateness validation
-            appropriateness_score = await self._validate_appropriateness(
+            appropriateness_score = self._validate_appropriateness(
                 adapted_context, context
             )
             validation_scores['appropriateness'] = appropriateness_score
             
             # Tone consistency validation
-            tone_score = await self._validate_tone_consistency(
+            tone_score = self._validate_tone_consistency(
                 original_fingerprint, adapted_context, context
             )
             validation_scores['tone_consistency'] = tone_score
             
             # Overall confidence calculation
-            weights = {'authenticity': 0.4, 'appropriateness': 0.3, 'tone_consistency': 0.3}
             overall_confidence = sum(
-                validation_scores[key] * weights[key] 
-                for key in weights if key in validation_scores
+                validation_scores[key] * weight for key, weight in _VALIDATION_WEIGHTS
             )
             validation_scores['overall_confidence'] = overall_confidence
             
-            logger.debug(f"Adaptation validation scores: {validation_scores}")
+            logger.debug("Adaptation validation scores: %s", validation_scores)
             return validation_scores
             
         except Exception as e:
-            logger.error(f"Adaptation validation failed: {str(e)}")
+            logger.error("Adaptation validation failed: %s", e)
             return {'authenticity': 0.5, 'appropriateness': 0.5, 'overall_confidence': 0.5}
     
     async def get_adaptation_strategies(
@@ -225,44 +351,26 @@ class DynamicVoiceAdapter(VoiceAdaptationProtocol):
         Returns:
             List of recommended strategies
         """
-        strategies = []
-        
-        # Analyze context to recommend strategies
-        if context.context_type == ContextType.PROFESSIONAL:
-            strategies.extend([
-                AdaptationStrategy.ADAPT_TO_AUDIENCE,
-                AdaptationStrategy.CONTEXT_SPECIFIC
-            ])
-        elif context.context_type == ContextType.CASUAL:
-            strategies.extend([
-                AdaptationStrategy.PRESERVE_ORIGINAL,
-                AdaptationStrategy.BLEND_CONTEXTS
-            ])
-        elif context.context_type == ContextType.FORMAL:
-            strategies.extend([
-                AdaptationStrategy.CONTEXT_SPECIFIC,
-                AdaptationStrategy.ADAPT_TO_AUDIENCE
-            ])
-        else:
-            # Default strategies
-            strategies.extend([
-                AdaptationStrategy.ADAPT_TO_AUDIENCE,
-                AdaptationStrategy.BLEND_CONTEXTS
-            ])
-        
-        # Consider audience and platform
-        if context.audience and "professional" in context.audience.lower():
-            if AdaptationStrategy.CONTEXT_SPECIFIC not in strategies:
-                strategies.append(AdaptationStrategy.CONTEXT_SPECIFIC)
-        
-        if context.platform and context.platform.lower() in ['linkedin', 'email']:
-            if AdaptationStrategy.ADAPT_TO_AUDIENCE not in strategies:
-                strategies.append(AdaptationStrategy.ADAPT_TO_AUDIENCE)
-        
-        return strategies[:3]  # Return top 3 recommendations
+        # Audience and platform are bucketed so repeat contexts share cache entries
+        return list(_recommend_strategies(
+            context.context_type,
+            bool(context.audience and "professional" in context.audience.lower()),
+            bool(context.platform and context.platform.lower() in _AUDIENCE_ADAPT_PLATFORMS)
+        ))
+    
+    async def close(self) -> None:
+        """Wait for background audit-trail writes to finish."""
+        if self._pending_audits:
+            await asyncio.gather(*self._pending_audits, return_exceptions=True)
     
     # Private helper methods
     
+    def _audit_done(self, task: 'asyncio.Task[None]') -> None:
+        """Release a finished audit task and log its failure, if any."""
+        self._pending_audits.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Voice adaptation audit logging failed: %s", task.exception())
+    
     async def _validate_adaptation_permissions(
         self,
         voice_fingerprint: VoiceFingerprint,
@@ -283,28 +391,151 @@ class DynamicVoiceAdapter(VoiceAdaptationProtocol):
         self,
         voice_fingerprint: VoiceFingerprint,
         context: AdaptationContext,
-        strategy: AdaptationStrategy
-    ) -> str:
+        strategy_value: str
+    ) -> _AdaptationCacheKey:
         """Generate cache key for adaptation result."""
-        context_hash = hash(f"{context.context_type.value}_{context.audience}_{context.platform}")
-        return f"adapt_{voice_fingerprint.user_id}_{context_hash}_{strategy.value}"
+        return (
+            voice_fingerprint.user_id,
+            voice_fingerprint.content_hash,
+            context.context_type.value,
+            context.audience,
+            context.platform,
+            strategy_value
+        )
     
-    def _get_cached_adaptation(self, cache_key: str) -> Optional[AdaptationResult]:
+    def _get_cached_adaptation(self, cache_key: _AdaptationCacheKey) -> Optional[AdaptationResult]:
         """Get cached adaptation result if still valid."""
-        if cache_key in self.adaptation_cache:
-            # Check if cache is still valid (simple TTL check)
-            return self.adaptation_cache[cache_key]
-        return None
+        with self._cache_lock:
+            # Expired entries are dropped rather than served
+            self._expire_cached_adaptations(time.monotonic())
+            entry = self.adaptation_cache.get(cache_key)
+            if entry is None:
+                return None
+            self.adaptation_cache.move_to_end(cache_key)
+            return entry[0]
+    
+    def _cache_adaptation(self, cache_key: _AdaptationCacheKey, result: AdaptationResult) -> None:
+        """Cache adaptation result, evicting the least recently used entry."""
+        now = time.monotonic()
+        with self._cache_lock:
+            self._expire_cached_adaptations(now)
+            self.adaptation_cache[cache_key] = (result, now)
+            self._cache_order.append((cache_key, now))
+            if len(self.adaptation_cache) > self.max_cache_size:
+                self.adaptation_cache.popitem(last=False)
+            
+            # LRU evictions and re-cached keys leave stale records behind; rebuild
+            # from the live entries before they outnumber them
+            if len(self._cache_order) > 2 * self.max_cache_size:
+                live = sorted(
+                    ((key, cached_at) for key, (_, cached_at) in self.adaptation_cache.items()),
+                    key=itemgetter(1)
+                )
+                self._cache_order.clear()
+                self._cache_order.extend(live)
+    
+    def _expire_cached_adaptations(self, now: float) -> None:
+        """Drop entries older than the TTL, oldest first; the cache lock must be held."""
+        cutoff = now - self.cache_ttl_seconds
+        while self._cache_order and self._cache_order[0][1] < cutoff:
+            cache_key, cached_at = self._cache_order.popleft()
+            entry = self.adaptation_cache.get(cache_key)
+            # Keys evicted or re-cached since this record was written are left alone
+            if entry is not None and entry[1] == cached_at:
+                del self.adaptation_cache[cache_key]
+    
+    async def _adapt_permitted(
+        self,
+        voice_fingerprint: VoiceFingerprint,
+        context: AdaptationContext,
+        strategy: AdaptationStrategy,
+        strategy_value: str
+    ) -> Tuple[AdaptationResult, bool]:
+        """Adapt for one context of an already-permitted batch; flags fresh (uncached) results."""
+        start_time = time.perf_counter()
+        
+        try:
+            cache_key = self._generate_cache_key(voice_fingerprint, context, strategy_value)
+            cached_result = self._get_cached_adaptation(cache_key)
+            if cached_result:
+                logger.debug("Using cached adaptation for context: %s", context.context_type)
+                return cached_result, False
+            
+            if self.context_analyzer:
+                context = await self.context_analyzer.enhance_context_analysis(context)
+            
+            adaptation_result = await self._create_adaptation(
+                voice_fingerprint, context, strategy, strategy_value, cache_key, start_time
+            )
+            return adaptation_result, True
+            
+        except Exception as e:
+            logger.error("Voice adaptation failed: %s", e)
+            fallback = await self._create_fallback_adaptation(voice_fingerprint, context, strategy)
+            return fallback, False
     
-    def _cache_adaptation(self, cache_key: str, result: AdaptationResult) -> None:
-        """Cache adaptation result."""
-        # Simple cache management
-        if len(self.adaptation_cache) >= self.max_cache_size:
-            # Remove oldest entry
-            oldest_key = next(iter(self.adaptation_cache))
-            del self.adaptation_cache[oldest_key]
+    async def _create_adaptation(
+        self,
+        voice_fingerprint: VoiceFingerprint,
+        context: AdaptationContext,
+        strategy: AdaptationStrategy,
+        strategy_value: str,
+        cache_key: _AdaptationCacheKey,
+        start_time: float
+    ) -> AdaptationResult:
+        """Adapt, validate, cache and track a permitted adaptation."""
+        context_type_value = context.context_type.value
+        
+        # Apply adaptation strategy
+        adapted_context = await self._apply_adaptation_strategy(
+            voice_fingerprint, context, strategy
+        )
         
-        self.adaptation_cache[cache_key] = result
+        # Validate adaptation
+        validation_scores = await self.validate_adaptation(
+            voice_fingerprint, adapted_context, context
+        )
+        
+        # Create adaptation result
+        adaptation_result = AdaptationResult(
+            adapted_voice_context=adapted_context,
+            adaptation_strategy=strategy,
+            confidence_score=validation_scores.get('overall_confidence', 0.8),
+            adaptation_notes=self._generate_adaptation_notes(
+                voice_fingerprint, context, context_type_value, strategy_value
+            ),
+            original_patterns_preserved=self._identify_preserved_patterns(
+                voice_fingerprint, adapted_context
+            ),
+            patterns_modified=self._identify_modified_patterns(
+                voice_fingerprint, adapted_context
+            ),
+            context_analysis=self._analyze_context_details(context, context_type_value),
+            performance_metrics={
+                'adaptation_time_ms': (time.perf_counter() - start_time) * 1000,
+                'validation_score': validation_scores.get('authenticity', 0.0),
+                'appropriateness_score': validation_scores.get('appropriateness', 0.0)
+            }
+        )
+        
+        # Cache result
+        self._cache_adaptation(cache_key, adaptation_result)
+        
+        # Update performance metrics
+        self._update_performance_metrics(adaptation_result)
+        
+        return adaptation_result
+    
+    def _record_audit(self, patterns_accessed: List[str], context: Dict[str, Any]) -> None:
+        """Write a voice adaptation audit record in the background."""
+        audit_task = asyncio.create_task(self.audit_trail.log_voice_pattern_access(
+            user_id="current_user",  # TODO: Get from context
+            access_type="voice_adaptation",
+            patterns_accessed=patterns_accessed,
+            context=context
+        ))
+        self._pending_audits.add(audit_task)
+        audit_task.add_done_callback(self._audit_done)
     
     async def _apply_adaptation_strategy(
         self,
@@ -313,17 +544,8 @@ class DynamicVoiceAdapter(VoiceAdaptationProtocol):
         strategy: AdaptationStrategy
     ) -> Dict[str, Any]:
         """Apply specific adaptation strategy."""
-        if strategy == AdaptationStrategy.PRESERVE_ORIGINAL:
-            return await self._preserve_original_voice(voice_fingerprint, context)
-        elif strategy == AdaptationStrategy.ADAPT_TO_AUDIENCE:
-            return await self._adapt_to_audience(voice_fingerprint, context)
-        elif strategy == AdaptationStrategy.BLEND_CONTEXTS:
-            return await self._blend_contexts(voice_fingerprint, context)
-        elif strategy == AdaptationStrategy.CONTEXT_SPECIFIC:
-            return await self._apply_context_specific(voice_fingerprint, context)
-        else:
-            # Default to audience adaptation
-            return await self._adapt_to_audience(voice_fingerprint, context)
+        handler = self._strategy_dispatch.get(strategy, self._adapt_to_audience)
+        return await handler(voice_fingerprint, context)
     
     async def _preserve_original_voice(
         self,
@@ -404,7 +626,7 @@ class DynamicVoiceAdapter(VoiceAdaptationProtocol):
                 }
             )
     
-    async def _validate_authenticity(
+    def _validate_authenticity(
         self,
         original_fingerprint: VoiceFingerprint,
         adapted_context: Dict[str, Any]
@@ -420,7 +642,7 @@ class DynamicVoiceAdapter(VoiceAdaptationProtocol):
         
         return authenticity_score
     
-    async def _validate_appropriateness(
+    def _validate_appropriateness(
         self,
         adapted_context: Dict[str, Any],
         context: AdaptationContext
@@ -435,7 +657,7 @@ class DynamicVoiceAdapter(VoiceAdaptationProtocol):
         
         return appropriateness_score
     
-    async def _validate_tone_consistency(
+    def _validate_tone_consistency(
         self,
         original_fingerprint: VoiceFingerprint,
         adapted_context: Dict[str, Any],
@@ -451,16 +673,17 @@ class DynamicVoiceAdapter(VoiceAdaptationProtocol):
         
         return tone_score
     
-    async def _generate_adaptation_notes(
+    def _generate_adaptation_notes(
         self,
         voice_fingerprint: VoiceFingerprint,
         context: AdaptationContext,
-        strategy: AdaptationStrategy
+        context_type_value: str,
+        strategy_value: str
     ) -> List[str]:
         """Generate notes about the adaptation process."""
         notes = [
-            f"Applied {strategy.value} strategy",
-            f"Adapted for {context.context_type.value} context"
+            f"Applied {strategy_value} strategy",
+            f"Adapted for {context_type_value} context"
         ]
         
         if context.audience:
@@ -471,7 +694,7 @@ class DynamicVoiceAdapter(VoiceAdaptationProtocol):
         
         return notes
     
-    async def _identify_preserved_patterns(
+    def _identify_preserved_patterns(
         self,
         voice_fingerprint: VoiceFingerprint,
         adapted_context: Dict[str, Any]
@@ -480,7 +703,7 @@ class DynamicVoiceAdapter(VoiceAdaptationProtocol):
         # TODO: Implement pattern comparison
         return ["core_vocabulary", "sentence_structure", "personality_markers"]
     
-    async def _identify_modified_patterns(
+    def _identify_modified_patterns(
         self,
         voice_fingerprint: VoiceFingerprint,
         adapted_context: Dict[str, Any]
@@ -489,13 +712,14 @@ class DynamicVoiceAdapter(VoiceAdaptationProtocol):
         # TODO: Implement pattern comparison
         return ["formality_level", "audience_adaptation", "platform_optimization"]
     
-    async def _analyze_context_details(
+    def _analyze_context_details(
         self,
-        context: AdaptationContext
+        context: AdaptationContext,
+        context_type_value: str
     ) -> Dict[str, Any]:
         """Analyze detailed context information."""
         return {
-            'context_type': context.context_type.value,
+            'context_type': context_type_value,
             'formality_detected': context.formality_level or 0.5,
             'audience_analysis': context.audience or "general",
             'platform_requirements': context.platform or "generic"
@@ -528,16 +752,12 @@ class DynamicVoiceAdapter(VoiceAdaptationProtocol):
         self.adaptation_metrics['validation_scores'].append(
             result.performance_metrics.get('validation_score', 0)
         )
-        
-        # Keep only recent metrics (last 100)
-        for metric_list in self.adaptation_metrics.values():
-            if len(metric_list) > 100:
-                metric_list.pop(0)
     
     def get_performance_stats(self) -> Dict[str, Any]:
         """Get performance statistics."""
         stats = {}
         for metric_name, values in self.adaptation_metrics.items():
+            # sum/min/max each run as one C-level pass over the deque; no copy
             if values:
                 stats[metric_name] = {
                     'avg': sum(values) / len(values),
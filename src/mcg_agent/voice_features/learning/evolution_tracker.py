@@ -1,10 +1,15 @@
 """Evolution tracker for monitoring voice pattern evolution and regression detection."""
 
 import logging
+import math
 import statistics
-from typing import Dict, List, Optional, Any, Tuple
+from bisect import bisect_left, bisect_right
+from itertools import islice, pairwise
+from operator import attrgetter
+from typing import Dict, Iterable, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
-from collections import defaultdict
+from collections import Counter
+from dataclasses import dataclass
 
 from ..protocols.voice_learning_protocol import (
     EvolutionTrackingProtocol,
@@ -15,6 +20,79 @@ from ...voice.voice_fingerprint_extractor import VoiceFingerprint
 logger = logging.getLogger(__name__)
 
 
+def _mean_stdev(values: Iterable[float]) -> Tuple[float, float]:
+    """Mean and sample standard deviation in one pass (Welford's algorithm).
+    
+    The standard deviation is 0 for fewer than two values.
+    """
+    count = 0
+    mean = 0.0
+    sum_squares = 0.0
+    for value in values:
+        count += 1
+        delta = value - mean
+        mean += delta / count
+        sum_squares += (value - mean) * delta
+    
+    if not count:
+        raise statistics.StatisticsError('mean requires at least one data point')
+    return mean, math.sqrt(sum_squares / (count - 1)) if count > 1 else 0
+
+
+@dataclass
+class _RunningStats:
+    """Welford moments and sign counts, updated one value at a time."""
+    count: int = 0
+    mean: float = 0.0
+    sum_squares: float = 0.0
+    positive: int = 0
+    negative: int = 0
+    
+    def push(self, value: float) -> None:
+        """Add one value to the statistics."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.sum_squares += (value - self.mean) * delta
+        if value > 0:
+            self.positive += 1
+        elif value < 0:
+            self.negative += 1
+    
+    @property
+    def stdev(self) -> float:
+        """Sample standard deviation; 0 for fewer than two values."""
+        return math.sqrt(self.sum_squares / (self.count - 1)) if self.count > 1 else 0
+
+
+# Fingerprint sections captured in rollback data
+_ROLLBACK_SECTIONS = (
+    'personal_patterns',
+    'social_patterns',
+    'published_patterns',
+    'confidence_scores',
+    'metadata',
+)
+
+# Tone aspects and punctuation types compared between fingerprints
+_TONE_ASPECTS = ('formality', 'warmth', 'directness', 'enthusiasm')
+_PUNCTUATION_TYPES = ('exclamation', 'question', 'ellipsis')
+
+
+def _regression_id(timestamp: datetime) -> str:
+    """Identifier of a regression detected on the record with this timestamp."""
+    return f"reg_{timestamp.strftime('%Y%m%d_%H%M%S')}"
+
+
+def _trend_direction(average: float) -> str:
+    """Classify an average change as improving, declining or stable."""
+    if average > 0.01:
+        return 'improving'
+    if average < -0.01:
+        return 'declining'
+    return 'stable'
+
+
 class EvolutionTracker(EvolutionTrackingProtocol):
     """
     Evolution tracker that monitors voice pattern changes over time
@@ -30,18 +108,32 @@ class EvolutionTracker(EvolutionTrackingProtocol):
     def __init__(self):
         """Initialize evolution tracker."""
         # Evolution tracking configuration
-        self.tracking_config = {
+        self.tracking_config: Dict[str, Any] = {
             'min_change_threshold': 0.05,      # Minimum change to track
             'regression_threshold': 0.15,      # Performance drop threshold
             'trend_window_days': 30,           # Days for trend analysis
             'min_records_for_trend': 5,        # Minimum records for trend analysis
             'performance_weight': 0.7,         # Weight for performance metrics
-            'confidence_weight': 0.3           # Weight for confidence metrics
+            'confidence_weight': 0.3,          # Weight for confidence metrics
+            'max_history': 10000               # Evolution records kept in memory
         }
         
         # Evolution history storage (in production, this would be persistent)
         self.evolution_history: List[VoiceEvolutionRecord] = []
         
+        # Running confidence/performance statistics over evolution_history, so
+        # unwindowed trend analysis of the tracked history needs no full pass
+        self._confidence_stats = _RunningStats()
+        self._performance_stats = _RunningStats()
+        
+        # Whether evolution_history timestamps are non-decreasing, so time
+        # windows over it can be found by bisection
+        self._history_in_order = True
+        
+        # Most recent rollback snapshot; unchanged sections are shared with it
+        # rather than copied again for every evolution record
+        self._last_rollback_data: Optional[Dict[str, Any]] = None
+        
         # Performance tracking
         self.performance_metrics = {
             'total_evolutions_tracked': 0,
@@ -77,22 +169,22 @@ class EvolutionTracker(EvolutionTrackingProtocol):
         """
         try:
             # Analyze pattern changes
-            pattern_changes = await self._analyze_pattern_changes(
+            pattern_changes = self._analyze_pattern_changes(
                 old_fingerprint, new_fingerprint
             )
             
             # Calculate confidence change
-            confidence_change = await self._calculate_confidence_change(
+            confidence_change = self._calculate_confidence_change(
                 old_fingerprint, new_fingerprint
             )
             
             # Analyze performance impact
-            performance_impact = await self._analyze_performance_impact(
-                old_fingerprint, new_fingerprint, pattern_changes
+            performance_impact = self._analyze_performance_impact(
+                pattern_changes, confidence_change
             )
             
             # Create rollback data
-            rollback_data = await self._create_rollback_data(old_fingerprint)
+            rollback_data = self._create_rollback_data(old_fingerprint)
             
             # Create evolution record
             evolution_record = VoiceEvolutionRecord(
@@ -105,13 +197,19 @@ class EvolutionTracker(EvolutionTrackingProtocol):
             )
             
             # Store evolution record
+            if self.evolution_history and evolution_record.timestamp < self.evolution_history[-1].timestamp:
+                self._history_in_order = False  # wall clock moved backwards
             self.evolution_history.append(evolution_record)
+            self._confidence_stats.push(confidence_change)
+            self._performance_stats.push(performance_impact.get('overall_impact', 0))
+            if len(self.evolution_history) > self.tracking_config['max_history']:
+                self._trim_history()
             
             # Update metrics
             self.performance_metrics['total_evolutions_tracked'] += 1
             
             # Detect if this is an improvement or regression
-            overall_impact = await self._calculate_overall_impact(performance_impact)
+            overall_impact = self._calculate_overall_impact(performance_impact)
             if overall_impact > 0.1:
                 self.performance_metrics['improvements_detected'] += 1
                 logger.info(f"Voice improvement detected: {overall_impact:.2f}")
@@ -152,10 +250,17 @@ class EvolutionTracker(EvolutionTrackingProtocol):
             # Filter by time window if provided
             if time_window:
                 start_time, end_time = time_window
-                filtered_history = [
-                    record for record in evolution_history
-                    if start_time <= record.timestamp <= end_time
-                ]
+                if self._is_tracked_history(evolution_history) and self._history_in_order:
+                    timestamp = attrgetter('timestamp')
+                    filtered_history = evolution_history[
+                        bisect_left(evolution_history, start_time, key=timestamp):
+                        bisect_right(evolution_history, end_time, key=timestamp)
+                    ]
+                else:
+                    filtered_history = [
+                        record for record in evolution_history
+                        if start_time <= record.timestamp <= end_time
+                    ]
             else:
                 filtered_history = evolution_history
             
@@ -167,22 +272,22 @@ class EvolutionTracker(EvolutionTrackingProtocol):
                 }
             
             # Analyze confidence trends
-            confidence_trend = await self._analyze_confidence_trend(filtered_history)
+            confidence_trend = self._analyze_confidence_trend(filtered_history)
             
             # Analyze performance trends
-            performance_trend = await self._analyze_performance_trend(filtered_history)
+            performance_trend = self._analyze_performance_trend(filtered_history)
             
             # Analyze pattern change frequency
-            pattern_frequency = await self._analyze_pattern_change_frequency(filtered_history)
+            pattern_frequency = self._analyze_pattern_change_frequency(filtered_history)
             
             # Analyze trigger event patterns
-            trigger_patterns = await self._analyze_trigger_patterns(filtered_history)
+            trigger_patterns = self._analyze_trigger_patterns(filtered_history)
             
             # Calculate trend stability
-            stability_metrics = await self._calculate_stability_metrics(filtered_history)
+            stability_metrics = self._calculate_stability_metrics(filtered_history)
             
             # Identify concerning trends
-            concerning_trends = await self._identify_concerning_trends(
+            concerning_trends = self._identify_concerning_trends(
                 confidence_trend, performance_trend, stability_metrics
             )
             
@@ -198,7 +303,7 @@ class EvolutionTracker(EvolutionTrackingProtocol):
                 'trigger_patterns': trigger_patterns,
                 'stability_metrics': stability_metrics,
                 'concerning_trends': concerning_trends,
-                'overall_trend_direction': await self._determine_overall_trend_direction(
+                'overall_trend_direction': self._determine_overall_trend_direction(
                     confidence_trend, performance_trend
                 ),
                 'analysis_timestamp': datetime.now().isoformat()
@@ -226,49 +331,74 @@ class EvolutionTracker(EvolutionTrackingProtocol):
         Returns:
             List of detected regressions
         """
-        regressions = []
+        # Timestamps are formatted here, only for regressions that are returned
+        return [
+            {
+                'regression_id': _regression_id(record.timestamp),
+                'detected_at': record.timestamp.isoformat(),
+                **regression
+            }
+            for regression, record in self._find_regressions(evolution_history, performance_threshold)
+        ]
+    
+    def _find_regressions(
+        self,
+        evolution_history: List[VoiceEvolutionRecord],
+        performance_threshold: float
+    ) -> List[Tuple[Dict[str, Any], VoiceEvolutionRecord]]:
+        """Detect regressions, each paired with the evolution record it was found on.
+        
+        The regression dicts leave out the timestamp-derived 'regression_id' and
+        'detected_at' fields; callers derive them from the record as needed.
+        """
+        regressions: List[Tuple[Dict[str, Any], VoiceEvolutionRecord]] = []
         
         try:
             # Use recent history for regression detection
             recent_window = datetime.now() - timedelta(days=self.tracking_config['trend_window_days'])
-            recent_history = [
-                record for record in evolution_history
-                if record.timestamp >= recent_window
-            ]
+            if self._is_tracked_history(evolution_history) and self._history_in_order:
+                window_start = bisect_left(
+                    evolution_history, recent_window, key=attrgetter('timestamp')
+                )
+                recent_history = evolution_history[window_start:]
+            else:
+                recent_history = [
+                    record for record in evolution_history
+                    if record.timestamp >= recent_window
+                ]
             
             if len(recent_history) < 2:
                 return regressions
             
-            # Analyze performance trajectory
-            performance_trajectory = await self._calculate_performance_trajectory(recent_history)
+            regression_threshold = self.tracking_config['regression_threshold']
             
-            # Detect significant drops
-            for i, record in enumerate(recent_history[1:], 1):
-                current_performance = await self._calculate_record_performance(record)
-                previous_performance = await self._calculate_record_performance(recent_history[i-1])
+            # Detect significant drops; each record's performance (overall impact
+            # normalized to the 0-1 range) is computed once and carried forward
+            current_performance = recent_history[0].performance_impact.get('overall_impact', 0) + 0.5
+            for record in islice(recent_history, 1, None):
+                previous_performance = current_performance
+                current_performance = record.performance_impact.get('overall_impact', 0) + 0.5
                 
                 performance_drop = previous_performance - current_performance
                 
                 # Check if drop exceeds threshold
-                if (performance_drop > self.tracking_config['regression_threshold'] or
+                if (performance_drop > regression_threshold or
                     current_performance < performance_threshold):
                     
                     regression = {
-                        'regression_id': f"reg_{record.timestamp.strftime('%Y%m%d_%H%M%S')}",
-                        'detected_at': record.timestamp.isoformat(),
                         'trigger_event': record.trigger_event,
                         'performance_drop': performance_drop,
                         'current_performance': current_performance,
                         'previous_performance': previous_performance,
-                        'severity': await self._calculate_regression_severity(
+                        'severity': self._calculate_regression_severity(
                             performance_drop, current_performance
                         ),
-                        'affected_patterns': await self._identify_affected_patterns(record),
-                        'recommended_actions': await self._generate_regression_actions(record),
+                        'affected_patterns': self._identify_affected_patterns(record),
+                        'recommended_actions': self._generate_regression_actions(record),
                         'rollback_available': record.rollback_data is not None
                     }
                     
-                    regressions.append(regression)
+                    regressions.append((regression, record))
             
             # Update metrics
             if regressions:
@@ -297,43 +427,40 @@ class EvolutionTracker(EvolutionTrackingProtocol):
             Recommended rollback fingerprint or None
         """
         try:
-            # Detect recent regressions
-            regressions = await self.detect_regression(evolution_history)
+            # Detect recent regressions, keeping the record each was found on
+            regressions = self._find_regressions(evolution_history, 0.8)
             
             if not regressions:
                 return None
             
             # Find the most recent severe regression
             severe_regressions = [
-                reg for reg in regressions
+                (reg, record) for reg, record in regressions
                 if reg.get('severity', 'low') in ['high', 'critical']
             ]
             
             if not severe_regressions:
                 return None
             
-            # Get the most recent severe regression
-            latest_regression = max(severe_regressions, key=lambda x: x['detected_at'])
-            
-            # Find corresponding evolution record
-            regression_record = None
-            for record in evolution_history:
-                if record.timestamp.isoformat() == latest_regression['detected_at']:
-                    regression_record = record
-                    break
+            # Get the most recent severe regression and its evolution record
+            _, regression_record = max(
+                severe_regressions, key=lambda item: item[1].timestamp
+            )
             
-            if not regression_record or not regression_record.rollback_data:
+            if not regression_record.rollback_data:
                 return None
             
             # Create rollback fingerprint
-            rollback_fingerprint = await self._create_rollback_fingerprint(
+            rollback_fingerprint = self._create_rollback_fingerprint(
                 current_fingerprint, regression_record.rollback_data
             )
             
             # Update metrics
             self.performance_metrics['rollbacks_recommended'] += 1
             
-            logger.warning(f"Rollback recommended due to regression: {latest_regression['regression_id']}")
+            logger.warning(
+                f"Rollback recommended due to regression: {_regression_id(regression_record.timestamp)}"
+            )
             return rollback_fingerprint
             
         except Exception as e:
@@ -342,28 +469,62 @@ class EvolutionTracker(EvolutionTrackingProtocol):
     
     # Private helper methods
     
-    async def _analyze_pattern_changes(
+    def _trim_history(self) -> None:
+        """Drop the oldest evolution records beyond max_history.
+        
+        A tenth of the cap is dropped at once, so trimming and the rebuild of
+        the running statistics happen once per batch of appends.
+        """
+        max_history = self.tracking_config['max_history']
+        del self.evolution_history[:len(self.evolution_history) - max_history + max_history // 10]
+        
+        self._confidence_stats = _RunningStats()
+        self._performance_stats = _RunningStats()
+        for record in self.evolution_history:
+            self._confidence_stats.push(record.confidence_change)
+            self._performance_stats.push(record.performance_impact.get('overall_impact', 0))
+        self._history_in_order = all(
+            earlier.timestamp <= later.timestamp
+            for earlier, later in pairwise(self.evolution_history)
+        )
+    
+    def _is_tracked_history(self, evolution_history: List[VoiceEvolutionRecord]) -> bool:
+        """Whether the running statistics cover exactly this history."""
+        return (
+            evolution_history is self.evolution_history and
+            self._confidence_stats.count == len(evolution_history)
+        )
+    
+    def _analyze_pattern_changes(
         self,
         old_fingerprint: VoiceFingerprint,
         new_fingerprint: VoiceFingerprint
     ) -> Dict[str, Any]:
         """Analyze changes between voice fingerprints."""
+        if old_fingerprint.personal_patterns is new_fingerprint.personal_patterns:
+            # Identical patterns: tone, structure and style report no change and
+            # the overall magnitude is zero; only vocabulary overlap is reported
+            vocabulary_changes = self._analyze_vocabulary_changes(old_fingerprint, new_fingerprint)
+            unchanged: Dict[str, Any] = {'vocabulary_changes': vocabulary_changes} if vocabulary_changes else {}
+            unchanged['overall_magnitude'] = 0.0
+            return unchanged
+        
         changes = {}
         
         # Analyze each pattern type
         for analyzer_name, analyzer_func in self.pattern_analyzers.items():
-            pattern_changes = await analyzer_func(old_fingerprint, new_fingerprint)
+            pattern_changes = analyzer_func(old_fingerprint, new_fingerprint)
             if pattern_changes:
                 changes[analyzer_name] = pattern_changes
         
         # Overall change magnitude
-        changes['overall_magnitude'] = await self._calculate_overall_change_magnitude(
+        changes['overall_magnitude'] = self._calculate_overall_change_magnitude(
             old_fingerprint, new_fingerprint
         )
         
         return changes
     
-    async def _analyze_vocabulary_changes(
+    def _analyze_vocabulary_changes(
         self,
         old_fingerprint: VoiceFingerprint,
         new_fingerprint: VoiceFingerprint
@@ -377,19 +538,23 @@ class EvolutionTracker(EvolutionTrackingProtocol):
         
         # Calculate vocabulary overlap
         if old_vocab and new_vocab:
-            old_words = set(old_vocab.get('common_words', []))
-            new_words = set(new_vocab.get('common_words', []))
+            old_common = old_vocab.get('common_words', [])
+            new_common = new_vocab.get('common_words', [])
+            old_words = set(old_common)
+            # Fingerprint copies share unchanged pattern data; reuse the set
+            new_words = old_words if new_common is old_common else set(new_common)
             
             if old_words and new_words:
-                overlap = len(old_words.intersection(new_words))
-                total = len(old_words.union(new_words))
+                # Union and differences follow from the set sizes and overlap
+                overlap = len(old_words) if new_words is old_words else len(old_words & new_words)
+                total = len(old_words) + len(new_words) - overlap
                 changes['vocabulary_overlap'] = overlap / total if total > 0 else 0
-                changes['new_words_added'] = len(new_words - old_words)
-                changes['words_removed'] = len(old_words - new_words)
+                changes['new_words_added'] = len(new_words) - overlap
+                changes['words_removed'] = len(old_words) - overlap
         
         return changes
     
-    async def _analyze_tone_changes(
+    def _analyze_tone_changes(
         self,
         old_fingerprint: VoiceFingerprint,
         new_fingerprint: VoiceFingerprint
@@ -402,20 +567,19 @@ class EvolutionTracker(EvolutionTrackingProtocol):
         new_tone = new_fingerprint.personal_patterns.get('tone_patterns', {})
         
         # Calculate tone shifts
-        tone_aspects = ['formality', 'warmth', 'directness', 'enthusiasm']
-        
-        for aspect in tone_aspects:
+        threshold = self.tracking_config['min_change_threshold']
+        for aspect in _TONE_ASPECTS:
             old_value = old_tone.get(aspect, 0.5)
             new_value = new_tone.get(aspect, 0.5)
             
             if isinstance(old_value, (int, float)) and isinstance(new_value, (int, float)):
                 change = new_value - old_value
-                if abs(change) > self.tracking_config['min_change_threshold']:
+                if abs(change) > threshold:
                     changes[f'{aspect}_change'] = change
         
         return changes
     
-    async def _analyze_structure_changes(
+    def _analyze_structure_changes(
         self,
         old_fingerprint: VoiceFingerprint,
         new_fingerprint: VoiceFingerprint
@@ -438,7 +602,7 @@ class EvolutionTracker(EvolutionTrackingProtocol):
         
         return changes
     
-    async def _analyze_style_changes(
+    def _analyze_style_changes(
         self,
         old_fingerprint: VoiceFingerprint,
         new_fingerprint: VoiceFingerprint
@@ -456,13 +620,14 @@ class EvolutionTracker(EvolutionTrackingProtocol):
         
         if old_punct and new_punct:
             punct_changes = {}
-            for punct_type in ['exclamation', 'question', 'ellipsis']:
+            threshold = self.tracking_config['min_change_threshold']
+            for punct_type in _PUNCTUATION_TYPES:
                 old_freq = old_punct.get(punct_type, 0)
                 new_freq = new_punct.get(punct_type, 0)
                 
                 if old_freq > 0:
                     change = (new_freq - old_freq) / old_freq
-                    if abs(change) > self.tracking_config['min_change_threshold']:
+                    if abs(change) > threshold:
                         punct_changes[f'{punct_type}_frequency_change'] = change
             
             if punct_changes:
@@ -470,7 +635,7 @@ class EvolutionTracker(EvolutionTrackingProtocol):
         
         return changes
     
-    async def _calculate_confidence_change(
+    def _calculate_confidence_change(
         self,
         old_fingerprint: VoiceFingerprint,
         new_fingerprint: VoiceFingerprint
@@ -481,17 +646,15 @@ class EvolutionTracker(EvolutionTrackingProtocol):
         
         return new_avg - old_avg
     
-    async def _analyze_performance_impact(
+    def _analyze_performance_impact(
         self,
-        old_fingerprint: VoiceFingerprint,
-        new_fingerprint: VoiceFingerprint,
-        pattern_changes: Dict[str, Any]
+        pattern_changes: Dict[str, Any],
+        confidence_change: float
     ) -> Dict[str, float]:
         """Analyze performance impact of changes."""
         impact = {}
         
         # Calculate impact based on confidence change
-        confidence_change = await self._calculate_confidence_change(old_fingerprint, new_fingerprint)
         impact['confidence_impact'] = confidence_change
         
         # Calculate impact based on pattern stability
@@ -506,7 +669,7 @@ class EvolutionTracker(EvolutionTrackingProtocol):
         
         return impact
     
-    async def _calculate_overall_change_magnitude(
+    def _calculate_overall_change_magnitude(
         self,
         old_fingerprint: VoiceFingerprint,
         new_fingerprint: VoiceFingerprint
@@ -514,116 +677,133 @@ class EvolutionTracker(EvolutionTrackingProtocol):
         """Calculate overall magnitude of changes."""
         total_changes = 0
         total_patterns = 0
+        old_patterns_get = old_fingerprint.personal_patterns.get
         
         # Compare personal patterns
         for key, new_value in new_fingerprint.personal_patterns.items():
-            old_value = old_fingerprint.personal_patterns.get(key)
-            if old_value is not None:
-                if isinstance(old_value, (int, float)) and isinstance(new_value, (int, float)):
-                    change = abs(new_value - old_value)
-                    total_changes += change
+            old_value = old_patterns_get(key)
+            if old_value is None:
+                continue
+            if isinstance(old_value, (int, float)) and isinstance(new_value, (int, float)):
+                total_changes += abs(new_value - old_value)
+                total_patterns += 1
+            elif isinstance(old_value, list) and isinstance(new_value, list):
+                # Calculate list similarity; the union size follows from the
+                # intersection size, so no union set is built
+                old_set = set(old_value)
+                new_set = set(new_value)
+                if old_set or new_set:
+                    shared = len(old_set & new_set)
+                    total_changes += (1 - shared / (len(old_set) + len(new_set) - shared))
                     total_patterns += 1
-                elif isinstance(old_value, list) and isinstance(new_value, list):
-                    # Calculate list similarity
-                    old_set = set(old_value)
-                    new_set = set(new_value)
-                    if old_set or new_set:
-                        similarity = len(old_set.intersection(new_set)) / len(old_set.union(new_set))
-                        total_changes += (1 - similarity)
-                        total_patterns += 1
         
         return total_changes / total_patterns if total_patterns > 0 else 0
     
-    async def _create_rollback_data(self, old_fingerprint: VoiceFingerprint) -> Dict[str, Any]:
-        """Create rollback data for evolution record."""
-        return {
-            'personal_patterns': old_fingerprint.personal_patterns.copy(),
-            'social_patterns': old_fingerprint.social_patterns.copy(),
-            'published_patterns': old_fingerprint.published_patterns.copy(),
-            'confidence_scores': old_fingerprint.confidence_scores.copy(),
-            'metadata': old_fingerprint.metadata.copy(),
-            'rollback_timestamp': datetime.now().isoformat()
-        }
+    def _create_rollback_data(self, old_fingerprint: VoiceFingerprint) -> Dict[str, Any]:
+        """Create rollback data for evolution record.
+        
+        Sections equal to the previous snapshot reuse its copy, so only the
+        sections that changed between evolution events are copied. Snapshot
+        sections are never mutated in place.
+        """
+        previous = self._last_rollback_data
+        rollback_data: Dict[str, Any] = {}
+        for section in _ROLLBACK_SECTIONS:
+            patterns = getattr(old_fingerprint, section)
+            if previous is not None and previous[section] == patterns:
+                rollback_data[section] = previous[section]
+            else:
+                rollback_data[section] = patterns.copy()
+        rollback_data['rollback_timestamp'] = datetime.now().isoformat()
+        
+        self._last_rollback_data = rollback_data
+        return rollback_data
     
-    async def _calculate_overall_impact(self, performance_impact: Dict[str, float]) -> float:
+    def _calculate_overall_impact(self, performance_impact: Dict[str, float]) -> float:
         """Calculate overall impact score."""
         return performance_impact.get('overall_impact', 0.0)
     
-    async def _analyze_confidence_trend(self, evolution_history: List[VoiceEvolutionRecord]) -> Dict[str, Any]:
+    def _analyze_confidence_trend(self, evolution_history: List[VoiceEvolutionRecord]) -> Dict[str, Any]:
         """Analyze confidence trends over time."""
-        confidence_changes = [record.confidence_change for record in evolution_history]
+        if self._is_tracked_history(evolution_history):
+            average_change = self._confidence_stats.mean
+            volatility = self._confidence_stats.stdev
+        else:
+            average_change, volatility = _mean_stdev(
+                record.confidence_change for record in evolution_history
+            )
         
         return {
-            'average_change': statistics.mean(confidence_changes),
-            'trend_direction': 'improving' if statistics.mean(confidence_changes) > 0.01 else 
-                             'declining' if statistics.mean(confidence_changes) < -0.01 else 'stable',
-            'volatility': statistics.stdev(confidence_changes) if len(confidence_changes) > 1 else 0,
-            'total_records': len(confidence_changes)
+            'average_change': average_change,
+            'trend_direction': _trend_direction(average_change),
+            'volatility': volatility,
+            'total_records': len(evolution_history)
         }
     
-    async def _analyze_performance_trend(self, evolution_history: List[VoiceEvolutionRecord]) -> Dict[str, Any]:
+    def _analyze_performance_trend(self, evolution_history: List[VoiceEvolutionRecord]) -> Dict[str, Any]:
         """Analyze performance trends over time."""
-        performance_impacts = [
-            record.performance_impact.get('overall_impact', 0) 
-            for record in evolution_history
-        ]
+        if self._is_tracked_history(evolution_history):
+            stats = self._performance_stats
+        else:
+            # Moments and sign counts in a single pass
+            stats = _RunningStats()
+            for record in evolution_history:
+                stats.push(record.performance_impact.get('overall_impact', 0))
+            if not stats.count:
+                raise statistics.StatisticsError('mean requires at least one data point')
         
         return {
-            'average_impact': statistics.mean(performance_impacts),
-            'trend_direction': 'improving' if statistics.mean(performance_impacts) > 0.01 else
-                             'declining' if statistics.mean(performance_impacts) < -0.01 else 'stable',
-            'volatility': statistics.stdev(performance_impacts) if len(performance_impacts) > 1 else 0,
-            'positive_changes': len([x for x in performance_impacts if x > 0]),
-            'negative_changes': len([x for x in performance_impacts if x < 0])
+            'average_impact': stats.mean,
+            'trend_direction': _trend_direction(stats.mean),
+            'volatility': stats.stdev,
+            'positive_changes': stats.positive,
+            'negative_changes': stats.negative
         }
     
-    async def _analyze_pattern_change_frequency(self, evolution_history: List[VoiceEvolutionRecord]) -> Dict[str, Any]:
+    def _analyze_pattern_change_frequency(self, evolution_history: List[VoiceEvolutionRecord]) -> Dict[str, Any]:
         """Analyze frequency of different pattern changes."""
-        pattern_counts = defaultdict(int)
-        
-        for record in evolution_history:
-            for pattern_type in record.pattern_changes.keys():
-                pattern_counts[pattern_type] += 1
+        pattern_counts = Counter(
+            pattern_type
+            for record in evolution_history
+            for pattern_type in record.pattern_changes
+        )
         
         total_records = len(evolution_history)
         
         return {
-            'most_frequent_changes': dict(sorted(pattern_counts.items(), key=lambda x: x[1], reverse=True)[:5]),
+            'most_frequent_changes': dict(pattern_counts.most_common(5)),
             'change_frequencies': {k: v/total_records for k, v in pattern_counts.items()},
             'total_pattern_types': len(pattern_counts)
         }
     
-    async def _analyze_trigger_patterns(self, evolution_history: List[VoiceEvolutionRecord]) -> Dict[str, Any]:
+    def _analyze_trigger_patterns(self, evolution_history: List[VoiceEvolutionRecord]) -> Dict[str, Any]:
         """Analyze patterns in trigger events."""
-        trigger_counts = defaultdict(int)
-        
-        for record in evolution_history:
-            trigger_counts[record.trigger_event] += 1
+        trigger_counts = Counter(record.trigger_event for record in evolution_history)
         
         return {
-            'most_common_triggers': dict(sorted(trigger_counts.items(), key=lambda x: x[1], reverse=True)),
+            'most_common_triggers': dict(trigger_counts.most_common()),
             'trigger_diversity': len(trigger_counts),
             'total_triggers': len(evolution_history)
         }
     
-    async def _calculate_stability_metrics(self, evolution_history: List[VoiceEvolutionRecord]) -> Dict[str, Any]:
+    def _calculate_stability_metrics(self, evolution_history: List[VoiceEvolutionRecord]) -> Dict[str, Any]:
         """Calculate stability metrics."""
         if len(evolution_history) < 2:
             return {'insufficient_data': True}
         
-        # Calculate time between evolutions
-        time_deltas = []
-        for i in range(1, len(evolution_history)):
-            delta = (evolution_history[i].timestamp - evolution_history[i-1].timestamp).total_seconds() / 3600
-            time_deltas.append(delta)
+        # Calculate time between evolutions, in hours
+        average_hours, hours_stdev = _mean_stdev(
+            (later.timestamp - earlier.timestamp).total_seconds() / 3600
+            for earlier, later in pairwise(evolution_history)
+        )
         
         return {
-            'average_time_between_evolutions_hours': statistics.mean(time_deltas),
-            'evolution_frequency_stability': statistics.stdev(time_deltas) if len(time_deltas) > 1 else 0,
+            'average_time_between_evolutions_hours': average_hours,
+            'evolution_frequency_stability': hours_stdev,
             'total_evolution_span_days': (evolution_history[-1].timestamp - evolution_history[0].timestamp).days
         }
     
-    async def _identify_concerning_trends(
+    def _identify_concerning_trends(
         self,
         confidence_trend: Dict[str, Any],
         performance_trend: Dict[str, Any],
@@ -650,7 +830,7 @@ class EvolutionTracker(EvolutionTrackingProtocol):
         
         return concerns
     
-    async def _determine_overall_trend_direction(
+    def _determine_overall_trend_direction(
         self,
         confidence_trend: Dict[str, Any],
         performance_trend: Dict[str, Any]
@@ -670,18 +850,7 @@ class EvolutionTracker(EvolutionTrackingProtocol):
         else:
             return 'stable'
     
-    async def _calculate_performance_trajectory(self, evolution_history: List[VoiceEvolutionRecord]) -> List[float]:
-        """Calculate performance trajectory over time."""
-        return [
-            record.performance_impact.get('overall_impact', 0)
-            for record in evolution_history
-        ]
-    
-    async def _calculate_record_performance(self, record: VoiceEvolutionRecord) -> float:
-        """Calculate performance score for a single record."""
-        return record.performance_impact.get('overall_impact', 0) + 0.5  # Normalize to 0-1 range
-    
-    async def _calculate_regression_severity(self, performance_drop: float, current_performance: float) -> str:
+    def _calculate_regression_severity(self, performance_drop: float, current_performance: float) -> str:
         """Calculate regression severity."""
         if performance_drop > 0.3 or current_performance < 0.3:
             return 'critical'
@@ -692,11 +861,11 @@ class EvolutionTracker(EvolutionTrackingProtocol):
         else:
             return 'low'
     
-    async def _identify_affected_patterns(self, record: VoiceEvolutionRecord) -> List[str]:
+    def _identify_affected_patterns(self, record: VoiceEvolutionRecord) -> List[str]:
         """Identify patterns affected by regression."""
         return list(record.pattern_changes.keys())
     
-    async def _generate_regression_actions(self, record: VoiceEvolutionRecord) -> List[str]:
+    def _generate_regression_actions(self, record: VoiceEvolutionRecord) -> List[str]:
         """Generate recommended actions for regression."""
         actions = []
         
@@ -714,7 +883,7 @@ class EvolutionTracker(EvolutionTrackingProtocol):
         
         return actions
     
-    async def _create_rollback_fingerprint(
+    def _create_rollback_fingerprint(
         self,
         current_fingerprint: VoiceFingerprint,
         rollback_data: Dict[str, Any]
@@ -738,12 +907,20 @@ class EvolutionTracker(EvolutionTrackingProtocol):
     
     def get_tracking_statistics(self) -> Dict[str, Any]:
         """Get evolution tracking statistics."""
+        # Records at most 7 whole days old, i.e. newer than 8 days ago
+        recent_cutoff = datetime.now() - timedelta(days=8)
+        if self._is_tracked_history(self.evolution_history) and self._history_in_order:
+            recent_activity = len(self.evolution_history) - bisect_right(
+                self.evolution_history, recent_cutoff, key=attrgetter('timestamp')
+            )
+        else:
+            recent_activity = sum(
+                record.timestamp > recent_cutoff for record in self.evolution_history
+            )
+        
         return {
             'performance_metrics': self.performance_metrics.copy(),
             'total_records': len(self.evolution_history),
             'tracking_config': self.tracking_config.copy(),
-            'recent_activity': len([
-                record for record in self.evolution_history
-                if (datetime.now() - record.timestamp).days <= 7
-            ])
+            'recent_activity': recent_activity
         }
@@ -38,7 +38,7 @@ class AdaptationContext:
     formality_level: Optional[float] = None  # 0.0 = very casual, 1.0 = very formal
     urgency_level: Optional[float] = None    # 0.0 = no urgency, 1.0 = very urgent
     relationship_level: Optional[str] = None # "stranger", "acquaintance", "friend", "family"
-    metadata: Dict[str, Any] = None
+    metadata: Dict[str, Any] = None  # type: ignore[assignment]  # set to {} in __post_init__
     
     def __post_init__(self):
         if self.metadata is None:
@@ -0,0 +1,17 @@
+from mcg_agent.utils.sketch import CountMinSketch, TopKSketch
+
+
+def test_count_min_sketch_never_underestimates():
+    sketch = CountMinSketch(width=64, depth=3)
+    for i in range(500):
+        sketch.add(f"w{i % 50}")
+    assert all(sketch.query(f"w{i}") >= 10 for i in range(50))
+
+
+def test_top_k_sketch_tracks_heavy_hitters():
+    top = TopKSketch(k=3)
+    top.update(["a"] * 50 + ["b"] * 30 + ["c"] * 20 + [f"rare{i}" for i in range(200)])
+    items = top.items()
+    assert len(items) == 3
+    assert set(items) == {"a", "b", "c"}
+    assert items["a"] >= 50